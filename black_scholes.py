@@ -8,9 +8,14 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 
-from scipy.stats import norm
+import numpy as np
+from scipy.special import ndtr
+
+ArrayLike = Union[float, np.ndarray]
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
 
 
 @dataclass
@@ -25,15 +30,17 @@ class BlackScholesParams:
     option_type: str
 
 
-def _validate_option_type(option_type: str) -> None:
-    """Ensure the option type is supported.
+def _validate_option_type(option_type: str) -> str:
+    """Ensure the option type is supported and return it in lower case.
 
     Raises:
-        ValueError: If the option type is not "call" or "put".
+        ValueError: If the option type is not "call" or "put" (case-insensitive).
     """
 
+    option_type = option_type.lower()
     if option_type not in {"call", "put"}:
         raise ValueError('option_type must be "call" or "put"')
+    return option_type
 
 
 def _d1_d2(S: float, K: float, r: float, sigma: float, T: float) -> Tuple[float, float]:
@@ -61,34 +68,98 @@ def black_scholes_price(
         r: Continuously compounded risk-free rate.
         sigma: Annualized volatility of the underlying asset.
         T: Time to maturity in years.
-        option_type: "call" or "put".
+        option_type: "call" or "put" (case-insensitive).
 
     Returns:
         Theoretical option price.
     """
 
-    _validate_option_type(option_type)
+    option_type = _validate_option_type(option_type)
     d1, d2 = _d1_d2(S, K, r, sigma, T)
     discount_factor = math.exp(-r * T)
 
     if option_type == "call":
-        price = S * norm.cdf(d1) - K * discount_factor * norm.cdf(d2)
+        price = S * ndtr(d1) - K * discount_factor * ndtr(d2)
     else:  # put
-        price = K * discount_factor * norm.cdf(-d2) - S * norm.cdf(-d1)
+        price = K * discount_factor * ndtr(-d2) - S * ndtr(-d1)
     return price
 
 
-def black_scholes_greeks(
+def _vec_inputs(
+    S: ArrayLike,
+    K: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    T: ArrayLike,
+    option_type: Union[str, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Broadcast and validate array inputs; return them with an ``is_call`` mask."""
+
+    if isinstance(option_type, str):
+        is_call = np.asarray(_validate_option_type(option_type) == "call")
+    else:
+        types = np.char.lower(np.asarray(option_type, dtype=str))
+        if not np.isin(types, ("call", "put")).all():
+            raise ValueError('option_type must be "call" or "put"')
+        is_call = types == "call"
+
+    S, K, r, sigma, T, is_call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, r, sigma, T)), is_call
+    )
+    if np.any(T <= 0):
+        raise ValueError("Maturity T must be positive")
+    if np.any(sigma <= 0):
+        raise ValueError("Volatility sigma must be positive")
+    return S, K, r, sigma, T, is_call
+
+
+def black_scholes_price_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    T: ArrayLike,
+    option_type: Union[str, np.ndarray],
+) -> np.ndarray:
+    """Compute Black-Scholes prices for arrays of European options.
+
+    All inputs are broadcast against each other, so scalars and arrays can be
+    mixed freely (e.g. a grid of spots for a single strike). ``option_type`` is
+    either a single "call"/"put" string or an array of such strings.
+
+    Args:
+        S: Current price(s) of the underlying asset.
+        K: Strike price(s) of the option.
+        r: Continuously compounded risk-free rate(s).
+        sigma: Annualized volatility(ies) of the underlying asset.
+        T: Time(s) to maturity in years.
+        option_type: "call", "put", or an array of those values (case-insensitive).
+
+    Returns:
+        Array of theoretical option prices with the broadcast shape of the inputs.
+    """
+
+    S, K, r, sigma, T, is_call = _vec_inputs(S, K, r, sigma, T, option_type)
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    discount_factor = np.exp(-r * T)
+
+    # +1 for calls, -1 for puts: both payoffs share the same closed form.
+    sign = np.where(is_call, 1.0, -1.0)
+    return sign * (S * ndtr(sign * d1) - K * discount_factor * ndtr(sign * d2))
+
+
+def black_scholes_price_and_greeks(
     S: float, K: float, r: float, sigma: float, T: float, option_type: str
-) -> Dict[str, float]:
-    """Compute primary Greeks for a European option under Black-Scholes.
+) -> Tuple[float, Dict[str, float]]:
+    """Compute the Black-Scholes price and primary Greeks in a single pass.
 
-    Conventions:
-        - Delta: change in price per unit change in underlying.
-        - Gamma: change in delta per unit change in underlying.
-        - Vega: change in price per 1 point (i.e., 1.0 = 100%) change in volatility.
-        - Theta: change in price per year (continuously compounded rates).
-        - Rho: change in price per 1 point change in the risk-free rate.
+    ``d1``, ``d2``, the normal CDF/PDF terms and the discount factor are
+    evaluated once and shared between the price and every Greek, instead of
+    being recomputed by separate calls to :func:`black_scholes_price` and
+    :func:`black_scholes_greeks`. Greeks follow the conventions documented in
+    :func:`black_scholes_greeks`.
 
     Args:
         S: Current price of the underlying asset.
@@ -96,21 +167,23 @@ def black_scholes_greeks(
         r: Continuously compounded risk-free rate.
         sigma: Annualized volatility of the underlying asset.
         T: Time to maturity in years.
-        option_type: "call" or "put".
+        option_type: "call" or "put" (case-insensitive).
 
     Returns:
-        Dictionary with keys "delta", "gamma", "vega", "theta", and "rho".
+        Tuple of the option price and a dictionary with keys "delta", "gamma",
+        "vega", "theta", and "rho".
     """
 
-    _validate_option_type(option_type)
+    option_type = _validate_option_type(option_type)
     d1, d2 = _d1_d2(S, K, r, sigma, T)
-    pdf_d1 = norm.pdf(d1)
-    cdf_d1 = norm.cdf(d1)
-    cdf_d2 = norm.cdf(d2)
+    pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+    cdf_d1 = ndtr(d1)
+    cdf_d2 = ndtr(d2)
     discount_factor = math.exp(-r * T)
     sqrt_T = math.sqrt(T)
 
     if option_type == "call":
+        price = S * cdf_d1 - K * discount_factor * cdf_d2
         delta = cdf_d1
         theta = (
             -(S * pdf_d1 * sigma) / (2 * sqrt_T)
@@ -118,17 +191,21 @@ def black_scholes_greeks(
         )
         rho = K * T * discount_factor * cdf_d2
     else:
-        delta = cdf_d1 - 1
+        # Evaluate N(-x) directly: 1 - N(x) cancels for deep out-of-the-money puts.
+        cdf_md1 = ndtr(-d1)
+        cdf_md2 = ndtr(-d2)
+        price = K * discount_factor * cdf_md2 - S * cdf_md1
+        delta = -cdf_md1
         theta = (
             -(S * pdf_d1 * sigma) / (2 * sqrt_T)
-            + r * K * discount_factor * norm.cdf(-d2)
+            + r * K * discount_factor * cdf_md2
         )
-        rho = -K * T * discount_factor * norm.cdf(-d2)
+        rho = -K * T * discount_factor * cdf_md2
 
     gamma = pdf_d1 / (S * sigma * sqrt_T)
     vega = S * pdf_d1 * sqrt_T
 
-    return {
+    return price, {
         "delta": delta,
         "gamma": gamma,
         "vega": vega,
@@ -137,9 +214,92 @@ def black_scholes_greeks(
     }
 
 
+def black_scholes_price_and_greeks_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    T: ArrayLike,
+    option_type: Union[str, np.ndarray],
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Array version of :func:`black_scholes_price_and_greeks`.
+
+    Inputs are broadcast as in :func:`black_scholes_price_vec`.
+
+    Args:
+        S: Current price(s) of the underlying asset.
+        K: Strike price(s) of the option.
+        r: Continuously compounded risk-free rate(s).
+        sigma: Annualized volatility(ies) of the underlying asset.
+        T: Time(s) to maturity in years.
+        option_type: "call", "put", or an array of those values (case-insensitive).
+
+    Returns:
+        Tuple of the price array and a dictionary of Greek arrays with keys
+        "delta", "gamma", "vega", "theta", and "rho".
+    """
+
+    S, K, r, sigma, T, is_call = _vec_inputs(S, K, r, sigma, T, option_type)
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    pdf_d1 = _INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+    discounted_strike = K * np.exp(-r * T)
+
+    # +1 for calls, -1 for puts: N(sign * d) avoids the cancellation of
+    # 1 - N(d) for deep out-of-the-money puts.
+    sign = np.where(is_call, 1.0, -1.0)
+    cdf_d1 = ndtr(sign * d1)
+    cdf_d2 = ndtr(sign * d2)
+    price = sign * (S * cdf_d1 - discounted_strike * cdf_d2)
+    # Signed N(+/-d2) term shared by theta and rho.
+    signed_cdf_d2 = sign * cdf_d2
+    greeks = {
+        "delta": sign * cdf_d1,
+        "gamma": pdf_d1 / (S * sigma * sqrt_T),
+        "vega": S * pdf_d1 * sqrt_T,
+        "theta": (
+            -(S * pdf_d1 * sigma) / (2 * sqrt_T) - r * discounted_strike * signed_cdf_d2
+        ),
+        "rho": T * discounted_strike * signed_cdf_d2,
+    }
+    return price, greeks
+
+
+def black_scholes_greeks(
+    S: float, K: float, r: float, sigma: float, T: float, option_type: str
+) -> Dict[str, float]:
+    """Compute primary Greeks for a European option under Black-Scholes.
+
+    Conventions:
+        - Delta: change in price per unit change in underlying.
+        - Gamma: change in delta per unit change in underlying.
+        - Vega: change in price per 1 point (i.e., 1.0 = 100%) change in volatility.
+        - Theta: change in price per year (continuously compounded rates).
+        - Rho: change in price per 1 point change in the risk-free rate.
+
+    Args:
+        S: Current price of the underlying asset.
+        K: Strike price of the option.
+        r: Continuously compounded risk-free rate.
+        sigma: Annualized volatility of the underlying asset.
+        T: Time to maturity in years.
+        option_type: "call" or "put" (case-insensitive).
+
+    Returns:
+        Dictionary with keys "delta", "gamma", "vega", "theta", and "rho".
+    """
+
+    _, greeks = black_scholes_price_and_greeks(S, K, r, sigma, T, option_type)
+    return greeks
+
+
 __all__ = [
     "BlackScholesParams",
     "black_scholes_price",
+    "black_scholes_price_vec",
+    "black_scholes_price_and_greeks",
+    "black_scholes_price_and_greeks_vec",
     "black_scholes_greeks",
     "_d1_d2",
 ]
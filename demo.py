@@ -4,7 +4,11 @@ from __future__ import annotations
 import numpy as np
 import matplotlib.pyplot as plt
 
-from black_scholes import black_scholes_greeks, black_scholes_price
+from black_scholes import (
+    black_scholes_greeks,
+    black_scholes_price,
+    black_scholes_price_and_greeks_vec,
+)
 
 
 DEFAULT_PARAMS = {
@@ -36,79 +40,53 @@ def plot_prices_and_greeks() -> None:
 
     spot_values = np.linspace(50, 150, 200)
 
-    call_prices = np.array(
-        [
-            black_scholes_price(S=s, K=DEFAULT_PARAMS["K"], r=DEFAULT_PARAMS["r"], sigma=DEFAULT_PARAMS["sigma"], T=DEFAULT_PARAMS["T"], option_type="call")
-            for s in spot_values
-        ]
+    # One pass per option type yields prices and Greeks from shared d1/d2 terms.
+    call_prices, call_greeks = black_scholes_price_and_greeks_vec(
+        S=spot_values,
+        K=DEFAULT_PARAMS["K"],
+        r=DEFAULT_PARAMS["r"],
+        sigma=DEFAULT_PARAMS["sigma"],
+        T=DEFAULT_PARAMS["T"],
+        option_type="call",
     )
-    put_prices = np.array(
-        [
-            black_scholes_price(S=s, K=DEFAULT_PARAMS["K"], r=DEFAULT_PARAMS["r"], sigma=DEFAULT_PARAMS["sigma"], T=DEFAULT_PARAMS["T"], option_type="put")
-            for s in spot_values
-        ]
+    put_prices, put_greeks = black_scholes_price_and_greeks_vec(
+        S=spot_values,
+        K=DEFAULT_PARAMS["K"],
+        r=DEFAULT_PARAMS["r"],
+        sigma=DEFAULT_PARAMS["sigma"],
+        T=DEFAULT_PARAMS["T"],
+        option_type="put",
     )
 
-    call_greeks = [
-        black_scholes_greeks(
-            S=s,
-            K=DEFAULT_PARAMS["K"],
-            r=DEFAULT_PARAMS["r"],
-            sigma=DEFAULT_PARAMS["sigma"],
-            T=DEFAULT_PARAMS["T"],
-            option_type="call",
-        )
-        for s in spot_values
-    ]
-
-    put_greeks = [
-        black_scholes_greeks(
-            S=s,
-            K=DEFAULT_PARAMS["K"],
-            r=DEFAULT_PARAMS["r"],
-            sigma=DEFAULT_PARAMS["sigma"],
-            T=DEFAULT_PARAMS["T"],
-            option_type="put",
-        )
-        for s in spot_values
-    ]
-
-    call_deltas = np.array([g["delta"] for g in call_greeks])
-    put_deltas = np.array([g["delta"] for g in put_greeks])
-    call_vegas = np.array([g["vega"] for g in call_greeks])
-
-    plt.figure(figsize=(10, 8))
+    fig, (ax_price, ax_delta, ax_vega) = plt.subplots(3, 1, figsize=(10, 8))
 
     # Price plot
-    plt.subplot(3, 1, 1)
-    plt.plot(spot_values, call_prices, label="Call price", color="tab:blue")
-    plt.plot(spot_values, put_prices, label="Put price", color="tab:orange")
-    plt.title("Option price vs Spot price")
-    plt.xlabel("Spot price (S)")
-    plt.ylabel("Option price")
-    plt.legend()
-    plt.grid(True)
+    ax_price.plot(spot_values, call_prices, label="Call price", color="tab:blue")
+    ax_price.plot(spot_values, put_prices, label="Put price", color="tab:orange")
+    ax_price.set_title("Option price vs Spot price")
+    ax_price.set_xlabel("Spot price (S)")
+    ax_price.set_ylabel("Option price")
+    ax_price.legend()
+    ax_price.grid(True)
 
     # Delta plot
-    plt.subplot(3, 1, 2)
-    plt.plot(spot_values, call_deltas, label="Call delta", color="tab:green")
-    plt.plot(spot_values, put_deltas, label="Put delta", color="tab:red")
-    plt.title("Delta vs Spot price")
-    plt.xlabel("Spot price (S)")
-    plt.ylabel("Delta")
-    plt.legend()
-    plt.grid(True)
+    ax_delta.plot(spot_values, call_greeks["delta"], label="Call delta", color="tab:green")
+    ax_delta.plot(spot_values, put_greeks["delta"], label="Put delta", color="tab:red")
+    ax_delta.set_title("Delta vs Spot price")
+    ax_delta.set_xlabel("Spot price (S)")
+    ax_delta.set_ylabel("Delta")
+    ax_delta.legend()
+    ax_delta.grid(True)
 
     # Vega plot
-    plt.subplot(3, 1, 3)
-    plt.plot(spot_values, call_vegas, label="Call vega", color="tab:purple")
-    plt.title("Vega vs Spot price")
-    plt.xlabel("Spot price (S)")
-    plt.ylabel("Vega")
-    plt.legend()
-    plt.grid(True)
-
-    plt.tight_layout()
+    ax_vega.plot(spot_values, call_greeks["vega"], label="Call vega", color="tab:purple")
+    ax_vega.set_title("Vega vs Spot price")
+    ax_vega.set_xlabel("Spot price (S)")
+    ax_vega.set_ylabel("Vega")
+    ax_vega.legend()
+    ax_vega.grid(True)
+
+    fig.tight_layout()
     plt.show()
 
 
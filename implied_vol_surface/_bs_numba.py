@@ -0,0 +1,76 @@
+"""Numba-compiled Black-Scholes kernels for the implied volatility solver.
+
+These functions mirror :mod:`.black_scholes` and :mod:`.iv_solver` but run
+entirely in compiled code, so a whole option chain can be inverted without
+re-entering the Python interpreter at every Newton iteration. Numba is an
+optional dependency: importing this module raises ``ImportError`` when it is
+not installed and callers fall back to the pure Python solvers.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+from .black_scholes import _INV_SQRT_2PI
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+
+@njit(cache=True, fastmath=True)
+def _ndtr(x: float) -> float:
+    """Standard normal CDF expressed through the complementary error function."""
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _newton_nb(
+    prices: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    r: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+    sigma0: float,
+    tol: float,
+    maxit: int,
+) -> np.ndarray:
+    """
+    Run the Newton-Raphson implied volatility search on every option in parallel.
+
+    The iteration matches :func:`.iv_solver.implied_volatility_newton`: it stops
+    once the pricing error is below ``tol`` and gives up when vega vanishes or
+    ``sigma`` leaves ``[1e-4, 5]``. Options that fail to converge are reported
+    as ``np.nan`` so that the caller can apply a fallback method.
+    """
+    n = prices.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        sigma = sigma0
+        result = np.nan
+        # Everything that does not depend on sigma is hoisted out of the loop.
+        sqrt_T = math.sqrt(T[i])
+        discounted_strike = K[i] * math.exp(-r[i] * T[i])
+        log_forward = math.log(S[i] / discounted_strike)
+        for _ in range(maxit):
+            # Price and vega share a single d1/d2 evaluation.
+            sigma_sqrt_T = sigma * sqrt_T
+            d1 = log_forward / sigma_sqrt_T + 0.5 * sigma_sqrt_T
+            d2 = d1 - sigma_sqrt_T
+            if is_call[i]:
+                bs_price = S[i] * _ndtr(d1) - discounted_strike * _ndtr(d2)
+            else:
+                bs_price = discounted_strike * _ndtr(-d2) - S[i] * _ndtr(-d1)
+            diff = bs_price - prices[i]
+            if abs(diff) < tol:
+                result = sigma
+                break
+            vega = S[i] * sqrt_T * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+            if vega < 1e-8:
+                break
+            sigma -= diff / vega
+            if sigma <= 1e-4 or sigma > 5:
+                break
+        out[i] = result
+    return out
@@ -7,11 +7,28 @@ continuously compounded annual rate.
 """
 from __future__ import annotations
 
-from math import log, sqrt
-from typing import Tuple
+from math import exp, log, sqrt
+from typing import Tuple, Union
 
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
+
+ArrayLike = Union[float, np.ndarray]
+
+_INV_SQRT_2PI = 1.0 / sqrt(2.0 * np.pi)
+
+# Integer option type codes used on the hot paths instead of strings.
+CALL, PUT = 0, 1
+
+
+def _parse_type(option_type: str) -> int:
+    """Convert a ``"call"``/``"put"`` string (case-insensitive) to ``CALL``/``PUT``."""
+    option_type = option_type.lower()
+    if option_type == "call":
+        return CALL
+    if option_type == "put":
+        return PUT
+    raise ValueError("option_type must be either 'call' or 'put'.")
 
 
 def _d1_d2(S: float, K: float, r: float, sigma: float, T: float) -> Tuple[float, float]:
@@ -40,7 +57,7 @@ def _d1_d2(S: float, K: float, r: float, sigma: float, T: float) -> Tuple[float,
         raise ValueError("Sigma and T must be positive to compute d1 and d2.")
 
     denom = sigma * sqrt(T)
-    d1 = (log(S / K) + (r + 0.5 * sigma**2) * T) / denom
+    d1 = (log(S / K) + (r + 0.5 * sigma * sigma) * T) / denom
     d2 = d1 - denom
     return d1, d2
 
@@ -76,18 +93,82 @@ def black_scholes_price(
     float
         The theoretical Black-Scholes option price.
     """
-    option_type = option_type.lower()
-    if option_type not in {"call", "put"}:
-        raise ValueError("option_type must be either 'call' or 'put'.")
-    if sigma <= 0 or T <= 0:
-        raise ValueError("sigma and T must be strictly positive.")
+    if _parse_type(option_type) == CALL:
+        return _bs_call_fast(S, K, r, sigma, T)
+    return _bs_put_fast(S, K, r, sigma, T)
+
+
+def _bs_call_fast(S: float, K: float, r: float, sigma: float, T: float) -> float:
+    """Black-Scholes call price without option type handling."""
+    d1, d2 = _d1_d2(S, K, r, sigma, T)
+    return float(S * ndtr(d1) - K * exp(-r * T) * ndtr(d2))
+
 
+def _bs_put_fast(S: float, K: float, r: float, sigma: float, T: float) -> float:
+    """Black-Scholes put price without option type handling."""
     d1, d2 = _d1_d2(S, K, r, sigma, T)
+    return float(K * exp(-r * T) * ndtr(-d2) - S * ndtr(-d1))
+
+
+def black_scholes_price_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    T: ArrayLike,
+    option_type: Union[str, np.ndarray],
+) -> np.ndarray:
+    """
+    Compute Black-Scholes prices for arrays of European options.
+
+    Inputs are broadcast against each other so that scalars and arrays can be
+    mixed (e.g. a strike/maturity grid priced for a single spot). The whole
+    batch is evaluated with a handful of NumPy operations instead of one Python
+    call per option.
+
+    Parameters
+    ----------
+    S, K, r, sigma, T : float or np.ndarray
+        Spot, strike, continuously compounded rate, volatility and maturity,
+        with the same meaning as in :func:`black_scholes_price`.
+    option_type : str or np.ndarray
+        Either a single ``"call"``/``"put"`` string or an array of such
+        strings (case-insensitive).
+
+    Returns
+    -------
+    np.ndarray
+        Theoretical Black-Scholes prices with the broadcast shape of the inputs.
+    """
+    S, K, r, sigma, T = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, r, sigma, T))
+    )
+    if np.any(sigma <= 0) or np.any(T <= 0):
+        raise ValueError("sigma and T must be strictly positive.")
+
+    types = np.char.lower(np.asarray(option_type, dtype=str))
+    if not np.isin(types, ("call", "put")).all():
+        raise ValueError("option_type must be either 'call' or 'put'.")
+    is_call = types == "call"
+
+    return _bs_price_vec(S, K, r, sigma, T, is_call)
+
+
+def _bs_price_vec(
+    S: np.ndarray,
+    K: np.ndarray,
+    r: np.ndarray,
+    sigma: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+) -> np.ndarray:
+    """Unchecked Black-Scholes kernel on arrays; ``is_call`` is a boolean mask."""
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
     discounted_strike = K * np.exp(-r * T)
 
-    if option_type == "call":
-        price = S * norm.cdf(d1) - discounted_strike * norm.cdf(d2)
-    else:
-        price = discounted_strike * norm.cdf(-d2) - S * norm.cdf(-d1)
+    # +1 for calls, -1 for puts: both payoffs share the same closed form.
+    sign = np.where(is_call, 1.0, -1.0)
+    return sign * (S * ndtr(sign * d1) - discounted_strike * ndtr(sign * d2))
 
-    return float(price)
@@ -18,18 +18,23 @@ def load_option_data(filepath: str) -> pd.DataFrame:
     - option_price: observed option market price
     - option_type: "call" or "put"
     """
-    df = pd.read_csv(filepath)
+    # Let the CSV parser produce the final dtypes instead of casting afterwards.
+    df = pd.read_csv(
+        filepath,
+        dtype={
+            "underlying_price": np.float64,
+            "strike": np.float64,
+            "maturity": np.float64,
+            "rate": np.float64,
+            "option_price": np.float64,
+            "option_type": str,
+        },
+    )
     expected = {"underlying_price", "strike", "maturity", "rate", "option_price", "option_type"}
     missing = expected.difference(df.columns)
     if missing:
         raise ValueError(f"Missing required columns: {', '.join(sorted(missing))}")
 
-    df = df.copy()
-    df["underlying_price"] = df["underlying_price"].astype(float)
-    df["strike"] = df["strike"].astype(float)
-    df["maturity"] = df["maturity"].astype(float)
-    df["rate"] = df["rate"].astype(float)
-    df["option_price"] = df["option_price"].astype(float)
     df["option_type"] = df["option_type"].str.lower()
 
     valid_types = {"call", "put"}
@@ -47,45 +52,41 @@ def generate_mock_data(
     rate: float = 0.01,
     base_vol: float = 0.2,
     noise: float = 0.01,
+    seed: int | None = None,
 ) -> pd.DataFrame:
     """
     Generate a simple synthetic option chain for demonstration purposes.
 
     The generated prices use a quadratic smile around the spot and a mild term
     structure. Results are meant only for demo/testing, not for calibration.
+    The whole strike/maturity grid is priced with a single vectorized call and
+    the columns are assembled from typed arrays; ``seed`` controls the pricing
+    noise.
     """
-    from .black_scholes import black_scholes_price
+    from .black_scholes import black_scholes_price_vec
 
     maturities = maturities or [0.1, 0.25, 0.5, 1.0]
     strikes = np.linspace(0.7 * spot, 1.3 * spot, n_strikes)
+    K_grid, T_grid = np.meshgrid(strikes, np.asarray(maturities, dtype=float))
 
-    records = []
-    for T in maturities:
-        for K in strikes:
-            skew = 0.15 * ((K / spot - 1) ** 2)
-            sigma = base_vol + skew + 0.05 * np.log1p(T)
-            sigma = max(sigma, 1e-4)
-            call_price = black_scholes_price(spot, K, rate, sigma, T, "call")
-            put_price = black_scholes_price(spot, K, rate, sigma, T, "put")
-            records.append(
-                {
-                    "underlying_price": spot,
-                    "strike": K,
-                    "maturity": T,
-                    "rate": rate,
-                    "option_price": call_price + np.random.normal(0, noise),
-                    "option_type": "call",
-                }
-            )
-            records.append(
-                {
-                    "underlying_price": spot,
-                    "strike": K,
-                    "maturity": T,
-                    "rate": rate,
-                    "option_price": put_price + np.random.normal(0, noise),
-                    "option_type": "put",
-                }
-            )
+    sigma = base_vol + 0.15 * (K_grid / spot - 1) ** 2 + 0.05 * np.log1p(T_grid)
+    sigma = np.maximum(sigma, 1e-4)
+    # A trailing (call, put) axis yields one call row followed by one put row per
+    # (maturity, strike) pair once raveled, priced in a single vectorized call.
+    option_types = np.array(["call", "put"])
+    prices = black_scholes_price_vec(
+        spot, K_grid[..., None], rate, sigma[..., None], T_grid[..., None], option_types
+    ).ravel()
+    n_rows = prices.size
+    rng = np.random.default_rng(seed)
 
-    return pd.DataFrame(records)
+    return pd.DataFrame(
+        {
+            "underlying_price": np.full(n_rows, spot),
+            "strike": np.repeat(K_grid.ravel(), 2),
+            "maturity": np.repeat(T_grid.ravel(), 2),
+            "rate": np.full(n_rows, rate),
+            "option_price": prices + rng.normal(0, noise, size=n_rows),
+            "option_type": np.tile(option_types, n_rows // 2),
+        }
+    )
@@ -1,23 +1,87 @@
 """Implied volatility solvers using Black-Scholes pricing.
 
-This module provides Newton-Raphson and bisection routines to back out the
-implied volatility from observed option prices. Newton is attempted first for
-speed; in case of non-convergence the algorithm falls back to a robust
-bisection method.
+This module provides Newton-Raphson, Brent and bisection routines to back out
+the implied volatility from observed option prices. Newton is attempted first
+for speed; in case of non-convergence the scalar solver falls back to Brent's
+method and the vectorized solver to a robust bisection.
 """
 from __future__ import annotations
 
-from typing import Callable
+import math
+from typing import Callable, Tuple
 
 import numpy as np
+from scipy.optimize import brentq
+from scipy.special import ndtr
 
-from .black_scholes import black_scholes_price, _d1_d2
+from .black_scholes import (
+    CALL,
+    _INV_SQRT_2PI,
+    _bs_call_fast,
+    _bs_price_vec,
+    _bs_put_fast,
+    _parse_type,
+)
 
+try:
+    from ._bs_numba import _newton_nb
+except ImportError:  # numba is optional; use the NumPy solver instead
+    _newton_nb = None
 
-def _vega(S: float, K: float, r: float, sigma: float, T: float) -> float:
-    """Compute Black-Scholes vega (derivative of price with respect to sigma)."""
-    d1, _ = _d1_d2(S, K, r, sigma, T)
-    return float(S * np.sqrt(T) * np.exp(-0.5 * d1**2) / np.sqrt(2 * np.pi))
+
+def _bs_price_given_disc(
+    S: float, K: float, sqrt_T: float, disc: float, sigma: float, kind: int
+) -> Tuple[float, float]:
+    """
+    Black-Scholes price from a precomputed ``sqrt(T)`` and discount factor.
+
+    ``log(S / K) + r T`` is recovered as ``log(S / (K * disc))``, so ``r`` and
+    ``T`` only enter through the precomputed quantities. Returns the price
+    together with ``d1`` for reuse in :func:`_vega_given_sqrtT`.
+    """
+    if sigma <= 0 or sqrt_T <= 0:
+        raise ValueError("Sigma and T must be positive to compute d1 and d2.")
+    sigma_sqrt_T = sigma * sqrt_T
+    d1 = math.log(S / (K * disc)) / sigma_sqrt_T + 0.5 * sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+    if kind == CALL:
+        price = S * ndtr(d1) - K * disc * ndtr(d2)
+    else:
+        price = K * disc * ndtr(-d2) - S * ndtr(-d1)
+    return float(price), d1
+
+
+def _vega_given_sqrtT(S: float, sqrt_T: float, d1: float) -> float:
+    """Black-Scholes vega from a precomputed ``sqrt(T)`` and ``d1``."""
+    return S * sqrt_T * math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+
+
+def _price_vega_vec(
+    S: np.ndarray,
+    K: np.ndarray,
+    sqrt_T: np.ndarray,
+    disc: np.ndarray,
+    sigma: np.ndarray,
+    is_call: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array Black-Scholes price and vega from a single ``d1``/``d2`` evaluation.
+
+    Array counterpart of :func:`_bs_price_given_disc` followed by
+    :func:`_vega_given_sqrtT`; ``is_call`` is a boolean mask.
+    """
+    sigma_sqrt_T = sigma * sqrt_T
+    d1 = np.log(S / (K * disc)) / sigma_sqrt_T + 0.5 * sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+    sign = np.where(is_call, 1.0, -1.0)
+    price = sign * (S * ndtr(sign * d1) - K * disc * ndtr(sign * d2))
+    vega = S * sqrt_T * np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    return price, vega
+
+
+def _pricer(kind: int) -> Callable[[float, float, float, float, float], float]:
+    """Return the scalar Black-Scholes kernel for an integer option type."""
+    return _bs_call_fast if kind == CALL else _bs_put_fast
 
 
 def _newton(
@@ -26,18 +90,21 @@ def _newton(
     K: float,
     r: float,
     T: float,
-    option_type: str,
+    kind: int,
     initial_sigma: float,
     tol: float,
     max_iterations: int,
 ) -> float:
+    # r and T are fixed during the search: hoist sqrt(T) and the discount factor.
+    sqrt_T = math.sqrt(max(T, 0.0))
+    disc = math.exp(-r * T)
     sigma = initial_sigma
     for _ in range(max_iterations):
-        bs_price = black_scholes_price(S, K, r, sigma, T, option_type)
+        bs_price, d1 = _bs_price_given_disc(S, K, sqrt_T, disc, sigma, kind)
         diff = bs_price - price
         if abs(diff) < tol:
             return sigma
-        vega = _vega(S, K, r, sigma, T)
+        vega = _vega_given_sqrtT(S, sqrt_T, d1)
         if vega < 1e-8:
             break
         sigma -= diff / vega
@@ -62,11 +129,12 @@ def implied_volatility_newton(
 
     Parameters follow the Black-Scholes conventions; the risk-free rate ``r``
     uses continuous compounding. The method iteratively adjusts ``sigma`` using
-    the local derivative (vega). If the iteration exits the bounds ``[1e-4, 5]``
-    or fails to reach ``tol`` within ``max_iterations``, a ``RuntimeError`` is
-    raised.
+    the local derivative (vega), computed together with the price. If the
+    iteration exits the bounds ``[1e-4, 5]`` or fails to reach ``tol`` within
+    ``max_iterations``, a ``RuntimeError`` is raised.
     """
-    return _newton(price, S, K, r, T, option_type, initial_sigma, tol, max_iterations)
+    kind = _parse_type(option_type)
+    return _newton(price, S, K, r, T, kind, initial_sigma, tol, max_iterations)
 
 
 def implied_volatility_bisection(
@@ -88,8 +156,10 @@ def implied_volatility_bisection(
     changes sign between ``sigma_low`` and ``sigma_high``. If no sign change is
     detected, the function returns ``np.nan`` to signal failure.
     """
+    bs_price = _pricer(_parse_type(option_type))
+
     def price_error(sig: float) -> float:
-        return black_scholes_price(S, K, r, sig, T, option_type) - price
+        return bs_price(S, K, r, sig, T) - price
 
     low, high = sigma_low, sigma_high
     f_low, f_high = price_error(low), price_error(high)
@@ -123,17 +193,194 @@ def implied_volatility(
     High-level implied volatility solver.
 
     Newton-Raphson is attempted first for speed; upon failure the function
-    falls back to bisection. If both methods fail, ``np.nan`` is returned.
+    falls back to Brent's method on ``[1e-4, 5]``, which always converges when
+    the pricing error changes sign. If both methods fail, ``np.nan`` is
+    returned.
     """
+    kind = _parse_type(option_type)
     try:
-        return implied_volatility_newton(
-            price,
-            S,
-            K,
-            r,
-            T,
-            option_type,
-            initial_sigma=initial_sigma,
-        )
+        return _newton(price, S, K, r, T, kind, initial_sigma, 1e-6, 100)
     except Exception:
-        return implied_volatility_bisection(price, S, K, r, T, option_type)
+        pass
+
+    bs_price = _pricer(kind)
+
+    def price_error(sig: float) -> float:
+        return bs_price(S, K, r, sig, T) - price
+
+    try:
+        return brentq(price_error, 1e-4, 5.0, xtol=1e-6)
+    except (ValueError, RuntimeError):  # no sign change or no convergence
+        return np.nan
+
+
+def implied_volatility_newton_vec(
+    prices: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    r: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+    initial_sigma: float = 0.2,
+    tol: float = 1e-6,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """
+    Vectorized Newton-Raphson implied volatility over arrays of options.
+
+    This runs the same iteration as :func:`implied_volatility_newton` on every
+    option at once: each step prices only the options that are still active,
+    so the Python loop runs at most ``max_iterations`` times regardless of the
+    number of options. ``is_call`` is a boolean mask selecting calls. Options
+    that fail to converge (vanishing vega or ``sigma`` leaving ``[1e-4, 5]``)
+    are returned as ``np.nan`` instead of raising.
+    """
+    prices, S, K, r, T, is_call = np.broadcast_arrays(prices, S, K, r, T, is_call)
+    sqrt_T = np.sqrt(T)
+    disc = np.exp(-r * T)
+    sigma = np.full(prices.shape, initial_sigma, dtype=float)
+    ivs = np.full(prices.shape, np.nan)
+    active = np.ones(prices.shape, dtype=bool)
+
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        sig = sigma[active]
+        bs_price, vega = _price_vega_vec(
+            S[active], K[active], sqrt_T[active], disc[active], sig, is_call[active]
+        )
+        diff = bs_price - prices[active]
+        converged = np.abs(diff) < tol
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            new_sigma = sig - diff / vega
+        failed = ~converged & ((vega < 1e-8) | (new_sigma <= 1e-4) | (new_sigma > 5))
+
+        ivs[active] = np.where(converged, sig, np.nan)
+        sigma[active] = new_sigma
+        active[active] = ~(converged | failed)
+
+    return ivs
+
+
+def implied_volatility_bisection_vec(
+    prices: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    r: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+    sigma_low: float = 1e-4,
+    sigma_high: float = 5.0,
+    tol: float = 1e-6,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """
+    Vectorized bisection implied volatility over arrays of options.
+
+    Array counterpart of :func:`implied_volatility_bisection`. The bracket
+    update is branchless: every iteration evaluates all options and selects the
+    new bounds with ``np.where``, while options that have already converged are
+    frozen (their updates become no-ops). Options without a sign change of the
+    pricing error over ``[sigma_low, sigma_high]`` or that do not converge within
+    ``max_iterations`` are returned as ``np.nan``.
+    """
+    prices, S, K, r, T, is_call = np.broadcast_arrays(prices, S, K, r, T, is_call)
+    low = np.full(prices.shape, sigma_low, dtype=float)
+    high = np.full(prices.shape, sigma_high, dtype=float)
+    f_low = _bs_price_vec(S, K, r, low, T, is_call) - prices
+    f_high = _bs_price_vec(S, K, r, high, T, is_call) - prices
+    ivs = np.full(prices.shape, np.nan)
+    done = np.sign(f_low) == np.sign(f_high)
+
+    for _ in range(max_iterations):
+        if done.all():
+            break
+        mid = 0.5 * (low + high)
+        f_mid = _bs_price_vec(S, K, r, mid, T, is_call) - prices
+        converged = ~done & ((np.abs(f_mid) < tol) | ((high - low) < tol))
+        ivs = np.where(converged, mid, ivs)
+        done |= converged
+
+        move_low = ~done & (f_mid * f_low > 0)
+        move_high = ~done & ~move_low
+        low = np.where(move_low, mid, low)
+        f_low = np.where(move_low, f_mid, f_low)
+        high = np.where(move_high, mid, high)
+
+    return ivs
+
+
+def _within_arbitrage_bounds(
+    prices: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    r: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+    eps: float = 1e-6,
+) -> np.ndarray:
+    """
+    Flag prices lying within the no-arbitrage bounds of a European option.
+
+    Calls must satisfy ``max(S - K e^{-rT}, 0) <= price <= S`` and puts
+    ``max(K e^{-rT} - S, 0) <= price <= K e^{-rT}``; no volatility can
+    reproduce a price outside these bounds. ``eps`` absorbs rounding at the
+    edges.
+    """
+    discounted_strike = K * np.exp(-r * T)
+    forward_gap = np.where(is_call, S - discounted_strike, discounted_strike - S)
+    lower = np.maximum(forward_gap, 0.0)
+    upper = np.where(is_call, S, discounted_strike)
+    return (prices >= lower - eps) & (prices <= upper + eps)
+
+
+def implied_volatility_vec(
+    prices: np.ndarray,
+    S: np.ndarray,
+    K: np.ndarray,
+    r: np.ndarray,
+    T: np.ndarray,
+    is_call: np.ndarray,
+    initial_sigma: float = 0.2,
+) -> np.ndarray:
+    """
+    High-level implied volatility solver for arrays of options.
+
+    Vectorized counterpart of :func:`implied_volatility`: Newton-Raphson is run
+    on all options at once (in compiled code when Numba is installed) and the
+    options it fails on are retried with the vectorized bisection. Prices
+    outside the no-arbitrage bounds cannot be matched by any volatility and are
+    set to ``np.nan`` upfront, without running either solver; options for which
+    both methods fail are also returned as ``np.nan``.
+    """
+    prices, S, K, r, T, is_call = (
+        np.ascontiguousarray(a.ravel())
+        for a in np.broadcast_arrays(
+            np.asarray(prices, dtype=float),
+            np.asarray(S, dtype=float),
+            np.asarray(K, dtype=float),
+            np.asarray(r, dtype=float),
+            np.asarray(T, dtype=float),
+            np.asarray(is_call, dtype=bool),
+        )
+    )
+    ivs = np.full(prices.shape, np.nan)
+    valid = np.flatnonzero(_within_arbitrage_bounds(prices, S, K, r, T, is_call))
+    if valid.size == 0:
+        return ivs
+    prices, S, K, r, T, is_call = (a[valid] for a in (prices, S, K, r, T, is_call))
+
+    if _newton_nb is not None:
+        solved = _newton_nb(prices, S, K, r, T, is_call, initial_sigma, 1e-6, 100)
+    else:
+        solved = implied_volatility_newton_vec(
+            prices, S, K, r, T, is_call, initial_sigma=initial_sigma
+        )
+
+    retry = np.isnan(solved)
+    if retry.any():
+        solved[retry] = implied_volatility_bisection_vec(
+            prices[retry], S[retry], K[retry], r[retry], T[retry], is_call[retry]
+        )
+    ivs[valid] = solved
+    return ivs
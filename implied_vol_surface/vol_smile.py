@@ -1,9 +1,45 @@
 """Construct implied volatility smiles for given maturities."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from .iv_solver import implied_volatility
+from .iv_solver import implied_volatility_vec
+
+
+def _call_mask(option_type: pd.Series) -> np.ndarray:
+    """Boolean call mask for an ``option_type`` column of "call"/"put" strings."""
+    types = option_type.str.lower().to_numpy()
+    if not np.isin(types, ("call", "put")).all():
+        raise ValueError("option_type must be either 'call' or 'put'.")
+    return types == "call"
+
+
+def compute_iv_for_group(group: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute implied volatilities for every row of an already-filtered chain.
+
+    Parameters
+    ----------
+    group : pd.DataFrame
+        Option chain slice (typically a single maturity) containing columns:
+        underlying_price, strike, maturity, rate, option_price, option_type.
+
+    Returns
+    -------
+    pd.DataFrame
+        Copy of ``group`` with an additional ``implied_vol`` column.
+    """
+    return group.assign(
+        implied_vol=implied_volatility_vec(
+            group["option_price"].to_numpy(dtype=float),
+            group["underlying_price"].to_numpy(dtype=float),
+            group["strike"].to_numpy(dtype=float),
+            group["rate"].to_numpy(dtype=float),
+            group["maturity"].to_numpy(dtype=float),
+            _call_mask(group["option_type"]),
+        )
+    )
 
 
 def compute_iv_for_maturity(df: pd.DataFrame, maturity: float) -> pd.DataFrame:
@@ -23,28 +59,44 @@ def compute_iv_for_maturity(df: pd.DataFrame, maturity: float) -> pd.DataFrame:
     pd.DataFrame
         Filtered DataFrame with an additional ``implied_vol`` column.
     """
-    subset = df[df["maturity"].astype(float) == maturity].copy()
+    subset = df[df["maturity"].astype(float) == maturity]
     if subset.empty:
         return subset.assign(implied_vol=pd.NA)
-
-    subset["implied_vol"] = subset.apply(
-        lambda row: implied_volatility(
-            row.option_price,
-            row.underlying_price,
-            row.strike,
-            row.rate,
-            row.maturity,
-            row.option_type,
-        ),
-        axis=1,
-    )
-    return subset
+    return compute_iv_for_group(subset)
 
 
 def compute_all_smiles(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute implied volatilities across all strikes and maturities.
+
+    The columns are converted to NumPy arrays once, rows are reordered so that
+    each maturity forms a contiguous block (maturities in order of first
+    appearance, as with ``groupby(sort=False)``), and the whole chain is
+    solved in a single vectorized call. The result is attached to the
+    DataFrame only at the end.
     """
-    maturities = df["maturity"].unique()
-    frames = [compute_iv_for_maturity(df, float(T)) for T in maturities]
-    return pd.concat(frames, ignore_index=True)
+    arrs = {
+        col: df[col].to_numpy(dtype=float)
+        for col in ("underlying_price", "strike", "maturity", "rate", "option_price")
+    }
+    arrs["is_call"] = _call_mask(df["option_type"])
+
+    # Rows without a maturity belong to no smile, as with groupby.
+    rows = np.flatnonzero(~np.isnan(arrs["maturity"]))
+    _, first_seen, group = np.unique(
+        arrs["maturity"][rows], return_index=True, return_inverse=True
+    )
+    group_rank = np.argsort(np.argsort(first_seen))
+    order = rows[np.argsort(group_rank[group], kind="stable")]
+
+    ivs = implied_volatility_vec(
+        arrs["option_price"][order],
+        arrs["underlying_price"][order],
+        arrs["strike"][order],
+        arrs["rate"][order],
+        arrs["maturity"][order],
+        arrs["is_call"][order],
+    )
+    result = df.take(order).reset_index(drop=True)
+    result["implied_vol"] = ivs
+    return result
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-from scipy.interpolate import griddata
+from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
 
 
 def build_vol_surface(df_iv: pd.DataFrame, grid_size: int = 50) -> dict:
@@ -35,23 +35,16 @@ def build_vol_surface(df_iv: pd.DataFrame, grid_size: int = 50) -> dict:
     maturity_grid = np.linspace(maturities.min(), maturities.max(), grid_size)
     strikes_grid, maturities_grid = np.meshgrid(strike_grid, maturity_grid)
 
-    iv_grid = griddata(
-        points=(strikes, maturities),
-        values=ivs,
-        xi=(strikes_grid, maturities_grid),
-        method="linear",
-    )
+    # Triangulate the observations once and reuse the point set for the
+    # nearest-neighbor fallback instead of letting ``griddata`` redo it.
+    points = np.column_stack([strikes, maturities])
+    iv_grid = LinearNDInterpolator(points, ivs)(strikes_grid, maturities_grid)
 
     # Fill potential gaps with nearest-neighbor interpolation
-    if np.isnan(iv_grid).any():
-        iv_grid_nn = griddata(
-            points=(strikes, maturities),
-            values=ivs,
-            xi=(strikes_grid, maturities_grid),
-            method="nearest",
-        )
-        nan_mask = np.isnan(iv_grid)
-        iv_grid[nan_mask] = iv_grid_nn[nan_mask]
+    nan_mask = np.isnan(iv_grid)
+    if nan_mask.any():
+        nearest = NearestNDInterpolator(points, ivs)
+        iv_grid[nan_mask] = nearest(strikes_grid[nan_mask], maturities_grid[nan_mask])
 
     return {
         "strikes_grid": strikes_grid,
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Literal, Sequence
+from typing import Any, Callable, Literal, Sequence
 
 import numpy as np
 import pandas as pd
@@ -43,14 +43,40 @@ def price_european_mc(
 
 
 def estimate_mc_convergence(
-    pricing_func: Callable[..., float], n_paths_list: Sequence[int], **kwargs
+    pricing_func: Callable[..., Any], n_paths_list: Sequence[int], **kwargs
 ) -> pd.DataFrame:
-    """Estimate convergence of a Monte Carlo pricer over multiple path counts."""
-    results = []
-    for n_paths in n_paths_list:
-        price = pricing_func(n_paths=n_paths, **kwargs)
-        results.append(ConvergenceResult(n_paths=n_paths, price=price))
-    return pd.DataFrame(results)
+    """Estimate convergence of a Monte Carlo pricer over multiple path counts.
+
+    Pricers returning a result with ``payoffs`` and ``discount_factor`` (such as
+    :class:`~.asian_options.AsianResult`) are run once with the largest path
+    count, and each price is the discounted mean of a prefix of those payoffs.
+    Pricers returning a plain price are called once per path count.
+    """
+    if min(n_paths_list) <= 0:
+        raise ValueError("Every entry of n_paths_list must be a positive integer.")
+    max_n = max(n_paths_list)
+    result = pricing_func(n_paths=max_n, **kwargs)
+    if not hasattr(result, "payoffs"):
+        results = []
+        for n_paths in n_paths_list:
+            if n_paths != max_n:
+                price = pricing_func(n_paths=n_paths, **kwargs)
+            else:
+                price = result
+            results.append(ConvergenceResult(n_paths=n_paths, price=price))
+        return pd.DataFrame(results)
+
+    if len(result.payoffs) < max_n:
+        raise ValueError("pricing_func returned fewer payoffs than requested paths.")
+    cumulative = np.cumsum(result.payoffs, dtype=np.float64)
+    return pd.DataFrame(
+        [
+            ConvergenceResult(
+                n_paths=n, price=float(result.discount_factor * cumulative[n - 1] / n)
+            )
+            for n in n_paths_list
+        ]
+    )
 
 
 def compare_mc_vs_black_scholes(
@@ -2,22 +2,54 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import exp
+from math import exp, log, sqrt
 from typing import Literal, Optional
 
 import numpy as np
+import numpy.typing as npt
 
-from .mc_paths import generate_gbm_paths
+from .black_scholes import black_scholes_price
+from .mc_paths import (
+    _KERNEL_REQUIREMENTS,
+    _gbm_loop,
+    _growth_factors,
+    _kernel_seed,
+    _make_rng,
+    _sobol_normals,
+    generate_gbm_paths,
+)
+
+try:
+    from .mc_paths_numba import _gbm_asian_kernel
+except ImportError:  # numba is optional; only backend="numba" needs it
+    _gbm_asian_kernel = None
+
+try:
+    from ._kernels import gbm_asian_payoff
+except ImportError:  # compiled extension is optional; see the README to build it
+    gbm_asian_payoff = None
+
+try:
+    from .mc_kernels import gbm_asian as gbm_asian_aot
+except ImportError:  # built by compile_kernels.py; only backend="aot" needs it
+    gbm_asian_aot = None
 
 OptionType = Literal["call", "put"]
+Backend = Literal["numpy", "numba", "cython", "aot"]
+Engine = Literal["pseudo", "sobol"]
 
 
 @dataclass
 class AsianResult:
-    """Container for Asian option pricing results."""
+    """Container for Asian option pricing results.
+
+    ``price`` is ``discount_factor`` times the mean of the undiscounted
+    ``payoffs``; the default of 1.0 treats the payoffs as already discounted.
+    """
 
     price: float
     payoffs: np.ndarray
+    discount_factor: float = 1.0
 
 
 def _asian_payoff(averages: np.ndarray, K: float, option_type: OptionType) -> np.ndarray:
@@ -39,6 +71,10 @@ def price_asian_arithmetic_mc(
     option_type: OptionType = "call",
     antithetic: bool = False,
     seed: Optional[int] = None,
+    backend: Backend = "numpy",
+    dtype: npt.DTypeLike = np.float64,
+    engine: Engine = "pseudo",
+    control_variate: bool = False,
 ) -> AsianResult:
     """Price an arithmetic-average Asian option via Monte Carlo.
 
@@ -67,45 +103,203 @@ def price_asian_arithmetic_mc(
         Whether to employ antithetic variates for variance reduction.
     seed : int | None, optional
         Random seed for reproducibility.
+    backend : {"numpy", "numba", "cython", "aot"}, optional
+        ``"numba"`` runs a compiled kernel that fuses path simulation and
+        averaging in parallel (requires Numba); ``"cython"`` runs the
+        precompiled ``_kernels`` extension instead, and ``"aot"`` the serial
+        ``mc_kernels`` build of the Numba kernel made by ``compile_kernels.py``
+        (same payoffs as ``"numba"``, without JIT warm-up). None of them
+        supports antithetic variates, control variates or Sobol' draws, and
+        each uses its own random stream.
+    dtype : dtype-like, optional
+        Floating point type of the simulated paths (see
+        :func:`~.mc_paths.generate_gbm_paths`); the price is always averaged in
+        float64. The compiled backends always simulate in float64.
+    engine : {"pseudo", "sobol"}, optional
+        Source of the normal draws; ``"sobol"`` uses a scrambled Sobol'
+        sequence (quasi-Monte Carlo, NumPy backend only), see
+        :func:`~.mc_paths.generate_gbm_paths`.
+    control_variate : bool, optional
+        Whether to use the geometric-average payoff on the same paths as a
+        control variate, with its closed-form expectation from
+        :func:`price_asian_geometric_closed_form` (NumPy backend only). The
+        returned payoffs are then the control-adjusted samples.
 
     Returns
     -------
     AsianResult
         Estimated price and raw payoff samples.
     """
-    rng = np.random.default_rng(seed)
+    if backend in _KERNEL_REQUIREMENTS:
+        kernel = {
+            "numba": _gbm_asian_kernel,
+            "cython": gbm_asian_payoff,
+            "aot": gbm_asian_aot,
+        }[backend]
+        if kernel is None:
+            raise ImportError(_KERNEL_REQUIREMENTS[backend])
+        if antithetic or control_variate or engine != "pseudo":
+            raise ValueError(
+                f"The {backend} backend does not support antithetic variates, "
+                "control variates or engine='sobol'."
+            )
+        if option_type not in ("call", "put"):
+            raise ValueError("option_type must be either 'call' or 'put'.")
+        payoffs = kernel(
+            S0, K, r, sigma, T, n_steps, n_paths, _kernel_seed(seed),
+            0 if option_type == "call" else 1,
+        )
+        discount_factor = exp(-r * T)
+        return AsianResult(
+            price=discount_factor * payoffs.mean(),
+            payoffs=payoffs,
+            discount_factor=discount_factor,
+        )
+    if backend != "numpy":
+        raise ValueError("backend must be one of 'numpy', 'numba', 'cython' or 'aot'.")
 
     if antithetic:
         pair_count = n_paths // 2
         remainder = n_paths % 2
-        dt = T / n_steps
-        drift = (r - 0.5 * sigma**2) * dt
-        diffusion = sigma * np.sqrt(dt)
-
-        paths = np.empty((n_paths, n_steps + 1))
-        paths[:, 0] = S0
-
-        for t in range(1, n_steps + 1):
-            z = rng.standard_normal(pair_count + remainder)
-            if pair_count:
-                pos = np.exp(drift + diffusion * z[:pair_count])
-                neg = np.exp(drift - diffusion * z[:pair_count])
-                paths[:pair_count, t] = paths[:pair_count, t - 1] * pos
-                paths[pair_count : 2 * pair_count, t] = (
-                    paths[pair_count : 2 * pair_count, t - 1] * neg
-                )
-            if remainder:
-                idx = 2 * pair_count
-                step_factor = np.exp(drift + diffusion * z[-1])
-                paths[idx, t] = paths[idx, t - 1] * step_factor
+
+        # Same stream as drawing ``pair_count + remainder`` normals per step;
+        # paths 2i and 2i + 1 use +z and -z of the i-th draw, so that every
+        # prefix of the payoffs keeps its antithetic pairs, and an odd leftover
+        # path its own draw. Prices are stored time-major.
+        if engine == "sobol":
+            z = _sobol_normals(n_steps, pair_count + remainder, seed, dtype)
+        else:
+            rng = _make_rng(seed)
+            z = rng.standard_normal((n_steps, pair_count + remainder), dtype=dtype)
+        monitored = np.empty((n_steps, n_paths), dtype=dtype)
+        monitored[:, 0 : 2 * pair_count : 2] = z[:, :pair_count]
+        np.negative(z[:, :pair_count], out=monitored[:, 1 : 2 * pair_count : 2])
+        if remainder:
+            monitored[:, -1] = z[:, -1]
+        _gbm_loop(S0, r, sigma, T, monitored)
     else:
-        paths = generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed)
+        paths = generate_gbm_paths(
+            S0, r, sigma, T, n_steps, n_paths, seed, dtype, engine
+        ).T
+        monitored = paths[1:]
 
-    arithmetic_means = paths[:, 1:].mean(axis=1)
+    arithmetic_means = monitored.mean(axis=0)
     payoffs = _asian_payoff(arithmetic_means, K, option_type)
     discount_factor = exp(-r * T)
-    price = discount_factor * payoffs.mean()
-    return AsianResult(price=price, payoffs=payoffs)
+
+    if control_variate:
+        geometric_means = np.exp(np.log(monitored).mean(axis=0))
+        control = _asian_payoff(geometric_means, K, option_type).astype(np.float64)
+        expected_control = (
+            price_asian_geometric_closed_form(S0, K, r, sigma, T, n_steps, option_type)
+            / discount_factor
+        )
+        # Variance-minimizing coefficient beta = cov(P_arith, P_geo) / var(P_geo).
+        control_centered = control - control.mean()
+        control_var = control_centered @ control_centered
+        beta = (control_centered @ payoffs) / control_var if control_var > 0 else 0.0
+        payoffs = payoffs - beta * (control - expected_control)
+
+    price = discount_factor * payoffs.mean(dtype=np.float64)
+    return AsianResult(price=price, payoffs=payoffs, discount_factor=discount_factor)
+
+
+def price_asian_geometric_closed_form(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    option_type: OptionType = "call",
+) -> float:
+    """Closed-form price of a discretely monitored geometric-average Asian option.
+
+    The geometric average of the ``n_steps`` equally spaced monitoring prices
+    (excluding ``S0``) is log-normal under GBM, with
+
+    - ``E[log G] = log S0 + (r - sigma**2 / 2) * T * (n + 1) / (2 n)``
+    - ``Var[log G] = sigma**2 * T * (n + 1) * (2 n + 1) / (6 n**2)``
+
+    so the option is priced by the Black--Scholes formula on the forward of
+    ``G`` with an effective volatility (Kemna--Vorst).
+
+    Parameters
+    ----------
+    S0, K, r, sigma, T, n_steps, option_type
+        Same meaning as in :func:`price_asian_geometric_mc`.
+
+    Returns
+    -------
+    float
+        Price of the geometric-average Asian option.
+    """
+    n = n_steps
+    mean_log = log(S0) + (r - 0.5 * sigma**2) * T * (n + 1) / (2 * n)
+    var_log = sigma**2 * T * (n + 1) * (2 * n + 1) / (6 * n**2)
+    forward = exp(mean_log + 0.5 * var_log)
+    return black_scholes_price(
+        forward * exp(-r * T), K, r, sqrt(var_log / T), T, option_type
+    )
+
+
+def price_asian_arithmetic_streaming(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    option_type: OptionType = "call",
+    seed: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
+    tile_size: int = 16_384,
+) -> AsianResult:
+    """Price an arithmetic-average Asian option without storing the paths.
+
+    Equivalent to :func:`price_asian_arithmetic_mc` (without antithetic
+    variates), but the GBM simulation is fused with the averaging: only the
+    current spot and the running sum of each path are kept, so memory is
+    ``O(n_paths)`` instead of ``O(n_paths * n_steps)``. Paths are simulated in
+    tiles of ``tile_size`` so that these per-step vectors stay in cache.
+
+    Parameters
+    ----------
+    S0, K, r, sigma, T, n_steps, n_paths, option_type, seed, dtype
+        Same meaning as in :func:`price_asian_arithmetic_mc`.
+    tile_size : int, optional
+        Number of paths simulated together. The random stream is consumed tile
+        by tile, so results match :func:`price_asian_arithmetic_mc` for the same
+        seed only when ``n_paths <= tile_size``.
+
+    Returns
+    -------
+    AsianResult
+        Estimated price and raw payoff samples.
+    """
+    rng = _make_rng(seed)
+    dtype = np.dtype(dtype)
+    dt = T / n_steps
+    drift = dtype.type((r - 0.5 * sigma**2) * dt)
+    diffusion = dtype.type(sigma * np.sqrt(dt))
+
+    payoffs = np.empty(n_paths, dtype=dtype)
+    for start in range(0, n_paths, tile_size):
+        size = min(tile_size, n_paths - start)
+        spot = np.full(size, S0, dtype=dtype)
+        running_sum = np.zeros(size, dtype=dtype)
+        z = np.empty(size, dtype=dtype)
+        for _ in range(n_steps):
+            rng.standard_normal(out=z, dtype=dtype)
+            spot *= _growth_factors(z, drift, diffusion)
+            running_sum += spot
+        running_sum /= n_steps
+        payoffs[start : start + size] = _asian_payoff(running_sum, K, option_type)
+
+    discount_factor = exp(-r * T)
+    price = discount_factor * payoffs.mean(dtype=np.float64)
+    return AsianResult(price=price, payoffs=payoffs, discount_factor=discount_factor)
 
 
 def price_asian_geometric_mc(
@@ -118,15 +312,20 @@ def price_asian_geometric_mc(
     n_paths: int,
     option_type: OptionType = "call",
     seed: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
+    engine: Engine = "pseudo",
 ) -> AsianResult:
     """Price a geometric-average Asian option via Monte Carlo.
 
     The geometric average offers faster convergence and can be compared against
-    the known closed-form solution for additional validation.
+    the known closed-form solution for additional validation. ``dtype`` and
+    ``engine`` select the floating point type and the normal draws of the
+    simulated paths as in :func:`price_asian_arithmetic_mc`.
     """
-    paths = generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed)
-    log_prices = np.log(paths[:, 1:])
-    geometric_means = np.exp(log_prices.mean(axis=1))
+    paths = generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed, dtype, engine).T
+    log_prices = np.log(paths[1:])
+    geometric_means = np.exp(log_prices.mean(axis=0))
     payoffs = _asian_payoff(geometric_means, K, option_type)
-    price = exp(-r * T) * payoffs.mean()
-    return AsianResult(price=price, payoffs=payoffs)
+    discount_factor = exp(-r * T)
+    price = discount_factor * payoffs.mean(dtype=np.float64)
+    return AsianResult(price=price, payoffs=payoffs, discount_factor=discount_factor)
@@ -1,12 +1,48 @@
 """Monte Carlo pricing for barrier options."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from math import exp
-from typing import Optional
+from typing import Literal, Optional
 
 import numpy as np
+import numpy.typing as npt
 
-from .mc_paths import generate_gbm_paths
+from .mc_paths import (
+    _KERNEL_REQUIREMENTS,
+    _growth_factors,
+    _kernel_seed,
+    _make_rng,
+    generate_gbm_paths,
+)
+
+try:
+    from .mc_paths_numba import _gbm_barrier_kernel
+except ImportError:  # numba is optional; only backend="numba" needs it
+    _gbm_barrier_kernel = None
+
+try:
+    from ._kernels import gbm_barrier_payoff
+except ImportError:  # compiled extension is optional; see the README to build it
+    gbm_barrier_payoff = None
+
+try:
+    from .mc_kernels import gbm_barrier as gbm_barrier_aot
+except ImportError:  # built by compile_kernels.py; only backend="aot" needs it
+    gbm_barrier_aot = None
+
+
+@dataclass
+class BarrierResult:
+    """Container for barrier option pricing results.
+
+    ``price`` is ``discount_factor`` times the mean of the undiscounted
+    ``payoffs``; the default of 1.0 treats the payoffs as already discounted.
+    """
+
+    price: float
+    payoffs: np.ndarray
+    discount_factor: float = 1.0
 
 
 def price_barrier_up_and_out_call_mc(
@@ -19,14 +55,97 @@ def price_barrier_up_and_out_call_mc(
     n_steps: int,
     n_paths: int,
     seed: Optional[int] = None,
-) -> float:
+    backend: Literal["numpy", "numba", "cython", "aot"] = "numpy",
+    dtype: npt.DTypeLike = np.float64,
+) -> BarrierResult:
     """Price an up-and-out call via Monte Carlo simulation.
 
     The option is knocked out if the underlying crosses the barrier ``H`` at any
     monitoring date. Otherwise it pays the discounted European call payoff.
+    ``backend="numba"`` runs a compiled parallel kernel instead of the NumPy
+    simulation (requires Numba) and ``backend="cython"`` the precompiled
+    ``_kernels`` extension; ``backend="aot"`` runs the serial ``mc_kernels``
+    build of the Numba kernel made by ``compile_kernels.py``. The compiled
+    backends use their own random stream. ``dtype`` selects
+    the floating point type of the simulated paths (NumPy backend only); the
+    payoffs are always averaged in float64. Returns the estimated price along
+    with the undiscounted payoff samples.
+    """
+    if backend in _KERNEL_REQUIREMENTS:
+        kernel = {
+            "numba": _gbm_barrier_kernel,
+            "cython": gbm_barrier_payoff,
+            "aot": gbm_barrier_aot,
+        }[backend]
+        if kernel is None:
+            raise ImportError(_KERNEL_REQUIREMENTS[backend])
+        payoffs = kernel(S0, K, H, r, sigma, T, n_steps, n_paths, _kernel_seed(seed))
+        discount_factor = exp(-r * T)
+        return BarrierResult(
+            price=discount_factor * payoffs.mean(),
+            payoffs=payoffs,
+            discount_factor=discount_factor,
+        )
+    if backend != "numpy":
+        raise ValueError("backend must be one of 'numpy', 'numba', 'cython' or 'aot'.")
+
+    # Time-major view: reductions run over contiguous per-step rows.
+    paths = generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed, dtype).T
+    barrier_breached = (paths[1:] >= H).any(axis=0)
+    terminal_prices = paths[-1]
+    payoffs = terminal_prices - K
+    np.maximum(payoffs, 0.0, out=payoffs)
+    payoffs[barrier_breached] = 0.0
+    discount_factor = exp(-r * T)
+    price = discount_factor * payoffs.mean(dtype=np.float64)
+    return BarrierResult(price=price, payoffs=payoffs, discount_factor=discount_factor)
+
+
+def price_barrier_streaming(
+    S0: float,
+    K: float,
+    H: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    seed: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
+    tile_size: int = 16_384,
+) -> BarrierResult:
+    """Price an up-and-out call without storing the simulated paths.
+
+    Same estimator as :func:`price_barrier_up_and_out_call_mc`, but each step
+    only updates the current spot of the paths that are still alive, so memory
+    is ``O(n_paths)`` instead of ``O(n_paths * n_steps)`` and knocked-out paths
+    are no longer simulated. Paths are processed in cache-sized tiles of
+    ``tile_size``; the random stream is consumed tile by tile, so prices match
+    the full-path pricer for the same seed only when ``n_paths <= tile_size``.
     """
-    paths = generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed)
-    barrier_breached = (paths[:, 1:] >= H).any(axis=1)
-    terminal_prices = paths[:, -1]
-    payoffs = np.where(barrier_breached, 0.0, np.maximum(terminal_prices - K, 0.0))
-    return exp(-r * T) * payoffs.mean()
+    rng = _make_rng(seed)
+    dtype = np.dtype(dtype)
+    dt = T / n_steps
+    drift = dtype.type((r - 0.5 * sigma**2) * dt)
+    diffusion = dtype.type(sigma * np.sqrt(dt))
+
+    payoffs = np.zeros(n_paths, dtype=dtype)
+    for start in range(0, n_paths, tile_size):
+        size = min(tile_size, n_paths - start)
+        alive = np.arange(start, start + size)
+        spot = np.full(size, S0, dtype=dtype)
+        z = np.empty(size, dtype=dtype)
+        for _ in range(n_steps):
+            # Draw for every path of the tile to keep the random stream aligned
+            # with the full-path pricer, but only advance the surviving ones.
+            rng.standard_normal(out=z, dtype=dtype)
+            spot *= _growth_factors(z[alive - start], drift, diffusion)
+            below = spot < H
+            if not below.all():
+                alive = alive[below]
+                spot = spot[below]
+        payoffs[alive] = np.maximum(spot - K, 0.0)
+
+    discount_factor = exp(-r * T)
+    price = discount_factor * payoffs.mean(dtype=np.float64)
+    return BarrierResult(price=price, payoffs=payoffs, discount_factor=discount_factor)
@@ -2,16 +2,19 @@
 
 This module provides analytical pricing formulas for European call and put
 options under the assumptions of the Black--Scholes model. Functions include
-pricing and delta computation with detailed type hints for clarity.
+pricing and delta computation with detailed type hints for clarity, plus a
+vectorized pricer for arrays of options.
 """
 from __future__ import annotations
 
 from math import exp, log, sqrt
-from typing import Literal, Tuple
+from typing import Literal, Tuple, Union
 
-from scipy.stats import norm
+import numpy as np
+from scipy.special import ndtr
 
 OptionType = Literal["call", "put"]
+ArrayLike = Union[float, np.ndarray]
 
 
 def _d1_d2(S: float, K: float, r: float, sigma: float, T: float) -> Tuple[float, float]:
@@ -76,14 +79,60 @@ def black_scholes_price(
 
     discount = exp(-r * T)
     if option_type == "call":
-        price = S * norm.cdf(d1) - K * norm.cdf(d2) * discount
+        price = S * ndtr(d1) - K * ndtr(d2) * discount
     elif option_type == "put":
-        price = K * norm.cdf(-d2) * discount - S * norm.cdf(-d1)
+        price = K * ndtr(-d2) * discount - S * ndtr(-d1)
     else:
         raise ValueError("option_type must be either 'call' or 'put'.")
     return price
 
 
+def black_scholes_price_vec(
+    S: ArrayLike,
+    K: ArrayLike,
+    r: ArrayLike,
+    sigma: ArrayLike,
+    T: ArrayLike,
+    option_type: OptionType,
+) -> np.ndarray:
+    """Compute Black--Scholes prices for arrays of European options.
+
+    Inputs are broadcast against each other, so scalars and arrays can be mixed
+    (e.g. a strike grid for a single spot). The whole batch is priced with a
+    handful of NumPy operations instead of one Python call per option.
+
+    Parameters
+    ----------
+    S, K, r, sigma, T : float or np.ndarray
+        Spot, strike, risk-free rate, volatility and maturity, with the same
+        meaning as in :func:`black_scholes_price`.
+    option_type : {"call", "put"}
+        Type of the European options.
+
+    Returns
+    -------
+    np.ndarray
+        Black--Scholes prices with the broadcast shape of the inputs.
+    """
+    S, K, r, sigma, T = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, r, sigma, T))
+    )
+    if np.any(T <= 0):
+        raise ValueError("Time to maturity T must be positive.")
+    if np.any(sigma <= 0):
+        raise ValueError("Volatility sigma must be positive.")
+
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    discount = np.exp(-r * T)
+    if option_type == "call":
+        return S * ndtr(d1) - K * ndtr(d2) * discount
+    if option_type == "put":
+        return K * ndtr(-d2) * discount - S * ndtr(-d1)
+    raise ValueError("option_type must be either 'call' or 'put'.")
+
+
 def black_scholes_delta(
     S: float, K: float, r: float, sigma: float, T: float, option_type: OptionType
 ) -> float:
@@ -112,7 +161,7 @@ def black_scholes_delta(
     d1, _ = _d1_d2(S, K, r, sigma, T)
 
     if option_type == "call":
-        return norm.cdf(d1)
+        return ndtr(d1)
     if option_type == "put":
-        return norm.cdf(d1) - 1
+        return ndtr(d1) - 1
     raise ValueError("option_type must be either 'call' or 'put'.")
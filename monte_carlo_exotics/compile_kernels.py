@@ -0,0 +1,38 @@
+"""Ahead-of-time compile the Numba payoff kernels into the ``mc_kernels`` module.
+
+The JIT kernels in :mod:`.mc_paths_numba` are compiled on their first call,
+which can dominate short runs such as the demo scripts. This script builds the
+same kernels with ``numba.pycc`` into an extension module placed next to this
+file, used by the pricers through ``backend="aot"``: no compilation happens at
+run time and Numba itself is not needed. ``numba.pycc`` cannot compile
+``parallel=True`` code, so the precompiled kernels run the path chunks
+serially; they consume the same random streams and return the same payoffs as
+``backend="numba"``. Note that ``numba.pycc`` is deprecated upstream (pending
+removal since Numba 0.57), so this build may stop working with future Numba
+releases; the Cython extension in ``_kernels.pyx`` is the longer-term
+ahead-of-time option. Run it from the repository root with::
+
+    python -m monte_carlo_exotics.compile_kernels
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from monte_carlo_exotics.mc_paths_numba import _gbm_asian_kernel, _gbm_barrier_kernel
+
+cc = CC("mc_kernels")
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+# Export the Python source of the JIT kernels; ``prange`` compiles to ``range``.
+cc.export("gbm_asian", "f8[:](f8, f8, f8, f8, f8, i8, i8, i8, i8)")(
+    _gbm_asian_kernel.py_func
+)
+cc.export("gbm_barrier", "f8[:](f8, f8, f8, f8, f8, f8, i8, i8, i8)")(
+    _gbm_barrier_kernel.py_func
+)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -13,7 +13,7 @@ if __name__ == "__main__":
     T = 1.0
     n_steps = 252
 
-    price = price_barrier_up_and_out_call_mc(
+    result = price_barrier_up_and_out_call_mc(
         S0=S0,
         K=K,
         H=H,
@@ -24,4 +24,4 @@ if __name__ == "__main__":
         n_paths=100_000,
         seed=7,
     )
-    print(f"Up-and-out barrier call price: {price:.4f}")
+    print(f"Up-and-out barrier call price: {result.price:.4f}")
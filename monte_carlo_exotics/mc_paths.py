@@ -6,33 +6,129 @@ provided to scale across many simulated paths.
 """
 from __future__ import annotations
 
-from concurrent.futures import ProcessPoolExecutor
-from typing import Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, Optional, Union
 
 import numpy as np
+import numpy.typing as npt
+from scipy.special import ndtri
+from scipy.stats import qmc
 
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; fall back to plain NumPy
+    ne = None
 
-def _simulate_chunk(
-    S0: float,
-    r: float,
-    sigma: float,
-    T: float,
+try:
+    from .mc_paths_numba import _simulate_chunk_nb
+except ImportError:  # numba is optional; parallel chunks then run in NumPy
+    _simulate_chunk_nb = None
+
+
+def _make_rng(
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+) -> np.random.Generator:
+    """Return the random generator used by the Monte Carlo simulations.
+
+    Paths are driven by the ``SFC64`` bit generator, which produces normals
+    faster than NumPy's default ``PCG64``. ``seed`` may be an integer, ``None``
+    or a ``SeedSequence`` spawned for an independent parallel stream.
+    """
+    return np.random.Generator(np.random.SFC64(seed))
+
+
+# Compiled payoff backends of the pricers and what each of them needs installed.
+_KERNEL_REQUIREMENTS = {
+    "numba": "backend='numba' requires numba to be installed.",
+    "cython": "backend='cython' requires the compiled _kernels extension.",
+    "aot": "backend='aot' requires the mc_kernels module built by compile_kernels.py.",
+}
+
+
+def _kernel_seed(seed: Optional[Union[int, np.random.SeedSequence]]) -> int:
+    """Derive a seed for the compiled kernels from a user seed or seed sequence.
+
+    The result stays below ``2**31`` so that per-chunk offsets remain valid
+    32-bit seeds for Numba's generator.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return int(seed.generate_state(1)[0] >> 1)
+
+
+def _sobol_normals(
     n_steps: int,
     n_paths: int,
     seed: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
+) -> np.ndarray:
+    """Return scrambled Sobol' normals of shape ``(n_steps, n_paths)``.
+
+    Each path is one point of an ``n_steps``-dimensional scrambled Sobol'
+    sequence mapped to standard normals through the inverse CDF. The sequence
+    is best balanced when ``n_paths`` is a power of two.
+    """
+    sampler = qmc.Sobol(d=n_steps, scramble=True, seed=_make_rng(seed))
+    uniforms = np.ascontiguousarray(sampler.random(n_paths).T)
+    return ndtri(uniforms, out=uniforms).astype(dtype, copy=False)
+
+
+def _growth_factors(z: np.ndarray, drift: float, diffusion: float) -> np.ndarray:
+    """Return the GBM step factors ``exp(drift + diffusion * z)``.
+
+    With numexpr installed the whole expression is evaluated in one
+    multi-threaded pass without intermediate arrays; otherwise NumPy is used.
+    """
+    if ne is not None:
+        return ne.evaluate("exp(drift + diffusion * z)")
+    return np.exp(drift + diffusion * z)
+
+
+def _gbm_loop(
+    S0: float, r: float, sigma: float, T: float, normals: np.ndarray
 ) -> np.ndarray:
-    """Simulate a chunk of GBM paths for internal parallel use."""
-    rng = np.random.default_rng(seed)
+    """Turn time-major standard normals into GBM prices, in place.
+
+    ``normals`` has shape ``(n_steps, n_paths)``; row ``t`` drives the step to
+    monitoring date ``t + 1``. Its log-increments are accumulated along the time
+    axis and exponentiated in one pass, so the array ends up holding the prices
+    at dates ``1..n_steps`` (``S0`` itself is not included). This is the single
+    hot kernel shared by every NumPy path generator.
+    """
+    n_steps = normals.shape[0]
     dt = T / n_steps
-    drift = (r - 0.5 * sigma**2) * dt
-    diffusion = sigma * np.sqrt(dt)
+    drift = normals.dtype.type((r - 0.5 * sigma**2) * dt)
+    diffusion = normals.dtype.type(sigma * np.sqrt(dt))
 
-    paths = np.empty((n_paths, n_steps + 1), dtype=float)
-    paths[:, 0] = S0
-    for t in range(1, n_steps + 1):
-        z = rng.standard_normal(n_paths)
-        paths[:, t] = paths[:, t - 1] * np.exp(drift + diffusion * z)
-    return paths
+    normals *= diffusion
+    normals += drift
+    np.cumsum(normals, axis=0, out=normals)
+    np.exp(normals, out=normals)
+    normals *= S0
+    return normals
+
+
+def _simulate_chunk(
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    seed: Optional[Union[int, np.random.SeedSequence]],
+    out: np.ndarray,
+) -> None:
+    """Fill a time-major ``(n_steps + 1, n_chunk)`` block of GBM paths in place.
+
+    Used by the parallel generator on column slices of a shared output array.
+    The compiled Numba kernel runs without the GIL when available; the NumPy
+    fallback spends most of its time in GIL-releasing array operations.
+    """
+    if _simulate_chunk_nb is not None:
+        _simulate_chunk_nb(S0, r, sigma, T, _kernel_seed(seed), out)
+        return
+
+    out[0] = S0
+    out[1:] = _make_rng(seed).standard_normal(out[1:].shape, dtype=out.dtype)
+    _gbm_loop(S0, r, sigma, T, out[1:])
 
 
 def generate_gbm_paths(
@@ -43,6 +139,8 @@ def generate_gbm_paths(
     n_steps: int,
     n_paths: int,
     seed: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
+    engine: Literal["pseudo", "sobol"] = "pseudo",
 ) -> np.ndarray:
     """Generate GBM paths using vectorized simulation.
 
@@ -61,24 +159,37 @@ def generate_gbm_paths(
     n_paths : int
         Number of simulated Monte Carlo paths.
     seed : int | None, optional
-        Random seed for reproducibility.
+        Seed of the ``SFC64`` random stream, for reproducibility.
+    dtype : dtype-like, optional
+        Floating point type of the simulation. ``np.float32`` halves memory
+        traffic; its roundoff is far below the Monte Carlo error for
+        realistic path counts.
+    engine : {"pseudo", "sobol"}, optional
+        ``"sobol"`` replaces the pseudo-random normals by a scrambled Sobol'
+        sequence (quasi-Monte Carlo), which converges close to ``O(1/n_paths)``
+        for smooth payoffs. Use a power of two for ``n_paths``.
 
     Returns
     -------
     np.ndarray
-        Array of shape (n_paths, n_steps + 1) containing simulated paths.
+        Array of shape (n_paths, n_steps + 1) containing simulated paths. It is
+        a transposed view of time-major storage, so ``paths.T`` gives
+        contiguous ``(n_steps + 1, n_paths)`` rows for per-step reductions.
     """
-    rng = np.random.default_rng(seed)
-    dt = T / n_steps
-    drift = (r - 0.5 * sigma**2) * dt
-    diffusion = sigma * np.sqrt(dt)
+    if engine not in ("pseudo", "sobol"):
+        raise ValueError("engine must be either 'pseudo' or 'sobol'.")
 
-    paths = np.empty((n_paths, n_steps + 1), dtype=float)
-    paths[:, 0] = S0
-    for t in range(1, n_steps + 1):
-        z = rng.standard_normal(n_paths)
-        paths[:, t] = paths[:, t - 1] * np.exp(drift + diffusion * z)
-    return paths
+    # Time-major storage: each time step is one contiguous row. The normals are
+    # drawn straight into the path buffer in step-major order (same stream as
+    # one draw per step), then turned into prices in place.
+    paths = np.empty((n_steps + 1, n_paths), dtype=dtype)
+    paths[0] = S0
+    if engine == "sobol":
+        paths[1:] = _sobol_normals(n_steps, n_paths, seed, dtype)
+    else:
+        _make_rng(seed).standard_normal(out=paths[1:], dtype=paths.dtype)
+    _gbm_loop(S0, r, sigma, T, paths[1:])
+    return paths.T
 
 
 def generate_gbm_paths_parallel(
@@ -91,12 +202,17 @@ def generate_gbm_paths_parallel(
     n_workers: int | None = None,
     chunk_size: int = 10_000,
     seed: Optional[int] = None,
+    dtype: npt.DTypeLike = np.float64,
 ) -> np.ndarray:
     """Generate GBM paths using CPU parallelization.
 
     The function splits the total number of paths into chunks that are
-    simulated across multiple worker processes. Each chunk receives a derived
-    seed to keep reproducibility when desired.
+    simulated by a pool of threads directly into one preallocated array, so
+    there is no process start-up, pickling or final concatenation. With Numba
+    installed each chunk runs in a compiled kernel that releases the GIL.
+    Each chunk receives its own statistically independent stream spawned from
+    ``seed``, so results are reproducible when a seed is given (the Numba and
+    NumPy chunk kernels use different generators).
 
     Parameters
     ----------
@@ -113,35 +229,37 @@ def generate_gbm_paths_parallel(
     n_paths : int
         Total number of simulated paths.
     n_workers : int | None, optional
-        Number of worker processes. Defaults to the number of CPU cores.
+        Number of worker threads. Defaults to the ``ThreadPoolExecutor``
+        default, which scales with the number of CPU cores.
     chunk_size : int, optional
         Number of paths simulated per worker chunk.
     seed : int | None, optional
-        Base random seed for reproducibility.
+        Base random seed from which the per-chunk streams are spawned.
+    dtype : dtype-like, optional
+        Floating point type of the simulation, see :func:`generate_gbm_paths`.
 
     Returns
     -------
     np.ndarray
-        Array of shape (n_paths, n_steps + 1) with simulated paths.
+        Array of shape (n_paths, n_steps + 1) with simulated paths, returned as
+        a transposed view of time-major storage like :func:`generate_gbm_paths`.
     """
     if n_paths <= chunk_size:
-        return generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed)
-
-    rng = np.random.default_rng(seed)
-    seeds: Iterable[int] = rng.integers(0, 1_000_000_000, size=(n_paths + chunk_size - 1) // chunk_size)
-
-    chunk_sizes = [chunk_size] * (n_paths // chunk_size)
-    remainder = n_paths % chunk_size
-    if remainder:
-        chunk_sizes.append(remainder)
-
-    args = [
-        (S0, r, sigma, T, n_steps, size, int(seed_val))
-        for size, seed_val in zip(chunk_sizes, seeds)
-    ]
+        return generate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, seed, dtype)
 
-    with ProcessPoolExecutor(max_workers=n_workers) as executor:
-        results = executor.map(_simulate_chunk, *zip(*args))
+    starts = range(0, n_paths, chunk_size)
+    # Spawned seed sequences give independent, reproducible per-chunk streams.
+    chunk_seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    paths = np.empty((n_steps + 1, n_paths), dtype=dtype)
 
-    collected = [chunk for chunk in results]
-    return np.vstack(collected)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [
+            executor.submit(
+                _simulate_chunk, S0, r, sigma, T, chunk_seed,
+                paths[:, start : start + chunk_size],
+            )
+            for start, chunk_seed in zip(starts, chunk_seeds)
+        ]
+        for future in futures:
+            future.result()
+    return paths.T
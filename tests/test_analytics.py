@@ -0,0 +1,87 @@
+"""Tests for the Monte Carlo diagnostics helpers."""
+from __future__ import annotations
+
+from functools import partial
+
+import numpy as np
+import pytest
+
+from monte_carlo_exotics.analytics import estimate_mc_convergence, price_european_mc
+from monte_carlo_exotics.asian_options import AsianResult, price_asian_arithmetic_mc
+from monte_carlo_exotics.barrier_options import (
+    BarrierResult,
+    price_barrier_up_and_out_call_mc,
+)
+
+N_PATHS_LIST = [1_000, 5_000, 10_000, 20_000]
+
+asian_pricer = partial(
+    price_asian_arithmetic_mc,
+    S0=100.0,
+    K=100.0,
+    r=0.05,
+    sigma=0.2,
+    T=1.0,
+    n_steps=52,
+    antithetic=True,
+    seed=123,
+)
+barrier_pricer = partial(
+    price_barrier_up_and_out_call_mc,
+    S0=100.0,
+    K=100.0,
+    H=130.0,
+    r=0.05,
+    sigma=0.25,
+    T=1.0,
+    n_steps=52,
+    seed=7,
+)
+
+
+@pytest.mark.parametrize("pricer", [asian_pricer, barrier_pricer])
+def test_prices_are_discounted_prefix_means_of_one_run(pricer):
+    df = estimate_mc_convergence(pricer, N_PATHS_LIST)
+    full = pricer(n_paths=max(N_PATHS_LIST))
+
+    assert df["n_paths"].tolist() == N_PATHS_LIST
+    expected = [full.discount_factor * full.payoffs[:n].mean() for n in N_PATHS_LIST]
+    np.testing.assert_allclose(df["price"], expected, rtol=1e-12)
+    assert df["price"].iloc[-1] == pytest.approx(full.price, rel=1e-12)
+
+
+def test_prefix_estimates_have_the_shape_of_independent_runs():
+    prefix = estimate_mc_convergence(asian_pricer, N_PATHS_LIST)
+    independent = estimate_mc_convergence(
+        lambda n_paths: asian_pricer(n_paths=n_paths).price, N_PATHS_LIST
+    )
+
+    assert list(prefix.columns) == list(independent.columns) == ["n_paths", "price"]
+    assert prefix["n_paths"].tolist() == independent["n_paths"].tolist()
+    assert prefix["price"].dtype == independent["price"].dtype == np.float64
+    # Both estimate the same price: agree within Monte Carlo error.
+    payoffs = asian_pricer(n_paths=max(N_PATHS_LIST)).payoffs
+    for n, a, b in zip(N_PATHS_LIST, prefix["price"], independent["price"]):
+        stderr = payoffs[:n].std() / np.sqrt(n)
+        assert a == pytest.approx(b, abs=5 * np.sqrt(2) * stderr)
+
+
+def test_float_pricers_are_called_once_per_path_count():
+    pricer = partial(
+        price_european_mc, S0=100.0, K=100.0, r=0.05, sigma=0.2, T=1.0, n_steps=4
+    )
+    df = estimate_mc_convergence(pricer, [500, 2_000], seed=1)
+    expected = [pricer(n_paths=500, seed=1), pricer(n_paths=2_000, seed=1)]
+    assert df["price"].tolist() == expected
+
+
+@pytest.mark.parametrize("n_paths_list", [[0, 1_000], [-5, 1_000]])
+def test_non_positive_path_counts_are_rejected(n_paths_list):
+    with pytest.raises(ValueError, match="positive"):
+        estimate_mc_convergence(asian_pricer, n_paths_list)
+
+
+def test_result_discount_factor_defaults_to_one():
+    payoffs = np.array([1.0, 3.0])
+    assert AsianResult(price=2.0, payoffs=payoffs).discount_factor == 1.0
+    assert BarrierResult(price=2.0, payoffs=payoffs).discount_factor == 1.0
@@ -0,0 +1,69 @@
+"""Tests for the Asian option pricers."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from monte_carlo_exotics import asian_options
+from monte_carlo_exotics.asian_options import (
+    price_asian_arithmetic_mc,
+    price_asian_geometric_closed_form,
+    price_asian_geometric_mc,
+)
+from monte_carlo_exotics.black_scholes import black_scholes_price
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_single_date_geometric_closed_form_is_black_scholes(option_type):
+    # With one monitoring date the geometric average is the terminal price.
+    closed_form = price_asian_geometric_closed_form(S0, K, R, SIGMA, T, 1, option_type)
+    assert closed_form == pytest.approx(
+        black_scholes_price(S0, K, R, SIGMA, T, option_type), rel=1e-12
+    )
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("n_steps", [12, 52])
+def test_kemna_vorst_closed_form_matches_geometric_mc(option_type, n_steps):
+    n_paths = 2**17
+    result = price_asian_geometric_mc(
+        S0, K, R, SIGMA, T, n_steps, n_paths, option_type, seed=11
+    )
+    closed_form = price_asian_geometric_closed_form(
+        S0, K, R, SIGMA, T, n_steps, option_type
+    )
+    stderr = result.discount_factor * result.payoffs.std() / np.sqrt(n_paths)
+    assert result.price == pytest.approx(closed_form, abs=4 * stderr)
+
+
+def test_control_variate_agrees_with_plain_mc():
+    plain = price_asian_arithmetic_mc(S0, K, R, SIGMA, T, 16, 2**18, seed=0)
+    controlled = price_asian_arithmetic_mc(
+        S0, K, R, SIGMA, T, 16, 2**14, seed=0, control_variate=True
+    )
+    stderr = plain.discount_factor * plain.payoffs.std() / np.sqrt(2**18)
+    assert controlled.price == pytest.approx(plain.price, abs=4 * stderr)
+
+
+def test_control_variate_shrinks_the_spread_across_seeds():
+    def spread(use_cv):
+        prices = [
+            price_asian_arithmetic_mc(
+                S0, K, R, SIGMA, T, 16, 4_096, seed=seed, control_variate=use_cv
+            ).price
+            for seed in range(8)
+        ]
+        return np.std(prices)
+
+    assert spread(True) < spread(False) / 10
+
+
+def test_control_variate_is_numpy_only():
+    if asian_options._gbm_asian_kernel is None:
+        pytest.skip("numba is not installed")
+    with pytest.raises(ValueError, match="control variates"):
+        price_asian_arithmetic_mc(
+            S0, K, R, SIGMA, T, 16, 1_024, backend="numba", control_variate=True
+        )
@@ -0,0 +1,77 @@
+"""Tests for the compiled Monte Carlo backends of the exotic pricers."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from monte_carlo_exotics import asian_options, barrier_options
+from monte_carlo_exotics.asian_options import price_asian_arithmetic_mc
+from monte_carlo_exotics.barrier_options import price_barrier_up_and_out_call_mc
+
+ASIAN_KERNELS = {
+    "numba": asian_options._gbm_asian_kernel,
+    "cython": asian_options.gbm_asian_payoff,
+    "aot": asian_options.gbm_asian_aot,
+}
+BARRIER_KERNELS = {
+    "numba": barrier_options._gbm_barrier_kernel,
+    "cython": barrier_options.gbm_barrier_payoff,
+    "aot": barrier_options.gbm_barrier_aot,
+}
+
+
+@pytest.mark.parametrize(
+    "backend, attribute",
+    [
+        ("numba", "_gbm_asian_kernel"),
+        ("cython", "gbm_asian_payoff"),
+        ("aot", "gbm_asian_aot"),
+    ],
+)
+def test_missing_backend_raises_import_error(backend, attribute, monkeypatch):
+    monkeypatch.setattr(asian_options, attribute, None)
+    with pytest.raises(ImportError, match=backend):
+        price_asian_arithmetic_mc(
+            100.0, 100.0, 0.05, 0.2, 1.0, 12, 100, backend=backend
+        )
+
+
+def test_unknown_backend_raises_value_error():
+    with pytest.raises(ValueError, match="backend"):
+        price_barrier_up_and_out_call_mc(
+            100.0, 100.0, 130.0, 0.05, 0.2, 1.0, 12, 100, backend="cuda"
+        )
+
+
+@pytest.mark.parametrize("backend", sorted(ASIAN_KERNELS))
+def test_compiled_backends_agree_with_numpy(backend):
+    if ASIAN_KERNELS[backend] is None or BARRIER_KERNELS[backend] is None:
+        pytest.skip(f"backend={backend!r} is not available")
+    # Different random streams: compare within a few standard errors.
+    n_paths = 40_000
+    asian = price_asian_arithmetic_mc(
+        100.0, 100.0, 0.05, 0.2, 1.0, 52, n_paths, seed=1, backend=backend
+    )
+    reference = price_asian_arithmetic_mc(
+        100.0, 100.0, 0.05, 0.2, 1.0, 52, n_paths, seed=2
+    )
+    stderr = asian.payoffs.std() / np.sqrt(n_paths) * np.exp(-0.05)
+    assert asian.price == pytest.approx(reference.price, abs=5 * np.sqrt(2) * stderr)
+
+    barrier = price_barrier_up_and_out_call_mc(
+        100.0, 100.0, 130.0, 0.05, 0.25, 1.0, 52, n_paths, seed=1, backend=backend
+    )
+    reference = price_barrier_up_and_out_call_mc(
+        100.0, 100.0, 130.0, 0.05, 0.25, 1.0, 52, n_paths, seed=2
+    )
+    stderr = barrier.payoffs.std() / np.sqrt(n_paths) * np.exp(-0.05)
+    assert barrier.price == pytest.approx(reference.price, abs=5 * np.sqrt(2) * stderr)
+
+
+def test_aot_backend_matches_numba_backend():
+    if asian_options.gbm_asian_aot is None or asian_options._gbm_asian_kernel is None:
+        pytest.skip("needs both numba and the mc_kernels build")
+    args = (100.0, 100.0, 0.05, 0.2, 1.0, 52, 5_000)
+    aot = price_asian_arithmetic_mc(*args, seed=3, backend="aot")
+    jit = price_asian_arithmetic_mc(*args, seed=3, backend="numba")
+    np.testing.assert_allclose(aot.payoffs, jit.payoffs, rtol=1e-10)
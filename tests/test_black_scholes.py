@@ -0,0 +1,96 @@
+"""Tests for the root Black-Scholes module."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from black_scholes import (
+    black_scholes_greeks,
+    black_scholes_price,
+    black_scholes_price_and_greeks,
+    black_scholes_price_and_greeks_vec,
+    black_scholes_price_vec,
+)
+
+# Moneyness grid from deep out-of-the-money puts (K=25) to deep in-the-money.
+STRIKES = [25.0, 40.0, 60.0, 80.0, 100.0, 120.0, 160.0, 250.0]
+S, R, SIGMA, T = 100.0, 0.05, 0.2, 0.5
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("K", STRIKES)
+def test_fused_price_matches_black_scholes_price(K, option_type):
+    expected = black_scholes_price(S, K, R, SIGMA, T, option_type)
+    price, _ = black_scholes_price_and_greeks(S, K, R, SIGMA, T, option_type)
+    price_vec, _ = black_scholes_price_and_greeks_vec(S, K, R, SIGMA, T, option_type)
+    assert price == pytest.approx(expected, rel=1e-12, abs=0.0)
+    assert float(price_vec) == pytest.approx(expected, rel=1e-12, abs=0.0)
+
+
+def test_deep_otm_put_price_does_not_cancel_to_zero():
+    price, greeks = black_scholes_price_and_greeks(S, 25.0, R, SIGMA, T, "put")
+    assert price > 0.0
+    assert greeks["rho"] < 0.0
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_vec_greeks_match_scalar(option_type):
+    strikes = np.array(STRIKES)
+    prices, greeks = black_scholes_price_and_greeks_vec(
+        S, strikes, R, SIGMA, T, option_type
+    )
+    for i, K in enumerate(STRIKES):
+        price, expected = black_scholes_price_and_greeks(S, K, R, SIGMA, T, option_type)
+        assert prices[i] == pytest.approx(price, rel=1e-12, abs=0.0)
+        for name, value in expected.items():
+            assert greeks[name][i] == pytest.approx(value, rel=1e-10, abs=1e-300)
+        assert black_scholes_greeks(S, K, R, SIGMA, T, option_type) == expected
+
+
+def test_greeks_match_finite_differences():
+    h = 1e-4
+    for option_type in ("call", "put"):
+        _, greeks = black_scholes_price_and_greeks(S, 90.0, R, SIGMA, T, option_type)
+
+        def price(s=S, r=R, sigma=SIGMA):
+            return black_scholes_price(s, 90.0, r, sigma, T, option_type)
+
+        assert greeks["delta"] == pytest.approx(
+            (price(s=S + h) - price(s=S - h)) / (2 * h), rel=1e-6
+        )
+        assert greeks["vega"] == pytest.approx(
+            (price(sigma=SIGMA + h) - price(sigma=SIGMA - h)) / (2 * h), rel=1e-6
+        )
+        assert greeks["rho"] == pytest.approx(
+            (price(r=R + h) - price(r=R - h)) / (2 * h), rel=1e-6
+        )
+
+
+def test_vec_broadcasts_option_type_array():
+    prices, greeks = black_scholes_price_and_greeks_vec(
+        S, 100.0, R, SIGMA, T, np.array(["call", "put"])
+    )
+    assert prices.shape == (2,)
+    call = black_scholes_price(S, 100.0, R, SIGMA, T, "call")
+    put = black_scholes_price(S, 100.0, R, SIGMA, T, "put")
+    assert prices[0] == pytest.approx(call)
+    assert prices[1] == pytest.approx(put)
+    assert greeks["delta"][0] - greeks["delta"][1] == pytest.approx(1.0)
+
+
+def test_option_type_is_case_insensitive():
+    call = black_scholes_price(S, 100.0, R, SIGMA, T, "call")
+    put = black_scholes_price(S, 100.0, R, SIGMA, T, "put")
+    assert black_scholes_price(S, 100.0, R, SIGMA, T, "Call") == call
+    assert black_scholes_price_vec(S, 100.0, R, SIGMA, T, "CALL") == pytest.approx(call)
+    prices = black_scholes_price_vec(S, 100.0, R, SIGMA, T, np.array(["Call", "PUT"]))
+    np.testing.assert_allclose(prices, [call, put], rtol=1e-12)
+    price, _ = black_scholes_price_and_greeks(S, 100.0, R, SIGMA, T, "Put")
+    assert price == pytest.approx(put, rel=1e-12)
+
+
+def test_invalid_option_type_raises():
+    with pytest.raises(ValueError):
+        black_scholes_price_vec(S, 100.0, R, SIGMA, T, np.array(["call", "c"]))
+    with pytest.raises(ValueError):
+        black_scholes_price(S, 100.0, R, SIGMA, T, "straddle")
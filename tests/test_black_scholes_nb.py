@@ -0,0 +1,50 @@
+"""Tests for the Numba Black-Scholes formulas against the SciPy-based module."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+pytest.importorskip("numba")
+
+from monte_carlo_exotics import black_scholes_nb  # noqa: E402
+from monte_carlo_exotics.black_scholes import (  # noqa: E402
+    black_scholes_delta,
+    black_scholes_price,
+)
+
+# Abramowitz-Stegun 7.1.26 bounds |erf error| by 1.5e-7, i.e. 7.5e-8 on N(x).
+CDF_TOL = 7.5e-8
+CODES = {"call": 0, "put": 1}
+
+
+def test_norm_cdf_matches_ndtr():
+    for x in np.linspace(-8.0, 8.0, 4_001):
+        assert black_scholes_nb._norm_cdf(x) == pytest.approx(ndtr(x), abs=CDF_TOL)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("K", [40.0, 80.0, 100.0, 120.0, 200.0])
+@pytest.mark.parametrize("T", [0.05, 1.0, 3.0])
+def test_price_and_delta_match_scipy_module(option_type, K, T):
+    S, r, sigma = 100.0, 0.03, 0.25
+    code = CODES[option_type]
+    # Price = S N(.) - K e^{-rT} N(.): each CDF error is scaled by S or K.
+    price_tol = (S + K) * CDF_TOL
+    price = black_scholes_nb.black_scholes_price(S, K, r, sigma, T, code)
+    delta = black_scholes_nb.black_scholes_delta(S, K, r, sigma, T, code)
+    assert price == pytest.approx(
+        black_scholes_price(S, K, r, sigma, T, option_type), abs=price_tol
+    )
+    assert delta == pytest.approx(
+        black_scholes_delta(S, K, r, sigma, T, option_type), abs=CDF_TOL
+    )
+
+
+def test_invalid_inputs_raise_value_error():
+    with pytest.raises(ValueError):
+        black_scholes_nb.black_scholes_price(100.0, 100.0, 0.05, 0.2, 1.0, 2)
+    with pytest.raises(ValueError):
+        black_scholes_nb.black_scholes_delta(100.0, 100.0, 0.05, -0.2, 1.0, 0)
+    with pytest.raises(ValueError):
+        black_scholes_nb.black_scholes_price(100.0, 100.0, 0.05, 0.2, 0.0, 0)
@@ -0,0 +1,128 @@
+"""Tests for the implied volatility solvers."""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from implied_vol_surface import iv_solver
+from implied_vol_surface.black_scholes import black_scholes_price_vec
+from implied_vol_surface.iv_solver import (
+    implied_volatility,
+    implied_volatility_bisection,
+    implied_volatility_bisection_vec,
+    implied_volatility_newton,
+    implied_volatility_newton_vec,
+    implied_volatility_vec,
+)
+from implied_vol_surface.vol_smile import compute_all_smiles, compute_iv_for_group
+
+
+@pytest.fixture(scope="module")
+def chain():
+    """Random option chain priced from known volatilities."""
+    rng = np.random.default_rng(0)
+    n = 500
+    S = np.full(n, 100.0)
+    K = rng.uniform(60.0, 140.0, n)
+    T = rng.uniform(0.05, 2.0, n)
+    r = rng.uniform(0.0, 0.06, n)
+    sigma = rng.uniform(0.1, 0.6, n)
+    is_call = rng.random(n) < 0.5
+    types = np.where(is_call, "call", "put")
+    prices = black_scholes_price_vec(S, K, r, sigma, T, types)
+    # Keep options with enough vega for a 1e-6 price tolerance to pin down sigma.
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    vega = S * np.sqrt(T) * np.exp(-0.5 * d1 * d1) / np.sqrt(2 * np.pi)
+    keep = vega > 1.0
+    return tuple(a[keep] for a in (prices, S, K, r, T, is_call, sigma))
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def newton_path(request, monkeypatch):
+    """Run implied_volatility_vec through the Numba kernel or the NumPy solver."""
+    if request.param == "numba":
+        if iv_solver._newton_nb is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(iv_solver, "_newton_nb", None)
+    return request.param
+
+
+def test_vec_matches_scalar_solver(chain, newton_path):
+    prices, S, K, r, T, is_call, sigma = chain
+    ivs = implied_volatility_vec(prices, S, K, r, T, is_call)
+    expected = [
+        implied_volatility(p, s, k, rr, t, "call" if c else "put")
+        for p, s, k, rr, t, c in zip(prices, S, K, r, T, is_call)
+    ]
+    # Both solvers stop on a 1e-6 price error; with vega > 1 that pins sigma
+    # to ~1e-6 whichever fallback (bisection or brentq) is used.
+    np.testing.assert_allclose(ivs, expected, atol=1e-5)
+    np.testing.assert_allclose(ivs, sigma, atol=1e-5)
+    types = np.where(is_call, "call", "put")
+    repriced = black_scholes_price_vec(S, K, r, ivs, T, types)
+    np.testing.assert_allclose(repriced, prices, atol=1e-5)
+
+
+def test_numba_and_numpy_paths_agree(chain, monkeypatch):
+    if iv_solver._newton_nb is None:
+        pytest.skip("numba is not installed")
+    prices, S, K, r, T, is_call, _ = chain
+    compiled = implied_volatility_vec(prices, S, K, r, T, is_call)
+    monkeypatch.setattr(iv_solver, "_newton_nb", None)
+    numpy_ivs = implied_volatility_vec(prices, S, K, r, T, is_call)
+    np.testing.assert_allclose(compiled, numpy_ivs, atol=1e-9)
+
+
+def test_newton_vec_matches_scalar_newton(chain):
+    prices, S, K, r, T, is_call, _ = chain
+    ivs = implied_volatility_newton_vec(prices, S, K, r, T, is_call)
+    for i in range(len(prices)):
+        option_type = "call" if is_call[i] else "put"
+        try:
+            expected = implied_volatility_newton(
+                prices[i], S[i], K[i], r[i], T[i], option_type
+            )
+        except RuntimeError:
+            assert np.isnan(ivs[i])
+        else:
+            assert ivs[i] == pytest.approx(expected, abs=1e-12)
+
+
+def test_bisection_vec_matches_scalar_bisection(chain):
+    prices, S, K, r, T, is_call, _ = chain
+    ivs = implied_volatility_bisection_vec(prices, S, K, r, T, is_call)
+    expected = [
+        implied_volatility_bisection(p, s, k, rr, t, "call" if c else "put")
+        for p, s, k, rr, t, c in zip(prices, S, K, r, T, is_call)
+    ]
+    np.testing.assert_allclose(ivs, expected, atol=1e-12)
+
+
+def test_prices_outside_arbitrage_bounds_are_nan(newton_path):
+    S, r, T = 100.0, 0.05, 1.0
+    K = np.array([100.0, 120.0, 100.0])
+    # Call above S, put below its intrinsic value K e^{-rT} - S, valid call.
+    prices = np.array([150.0, 0.5, 10.45])
+    is_call = np.array([True, False, True])
+    ivs = implied_volatility_vec(prices, S, K, r, T, is_call)
+    assert np.isnan(ivs[:2]).all()
+    assert ivs[2] == pytest.approx(0.2, abs=1e-4)
+
+
+def test_smiles_reject_invalid_option_types():
+    df = pd.DataFrame(
+        {
+            "underlying_price": [100.0, 100.0],
+            "strike": [100.0, 100.0],
+            "maturity": [1.0, 1.0],
+            "rate": [0.05, 0.05],
+            "option_price": [10.45, 5.57],
+            "option_type": ["Call", "c"],
+        }
+    )
+    with pytest.raises(ValueError, match="option_type"):
+        compute_all_smiles(df)
+    with pytest.raises(ValueError, match="option_type"):
+        compute_iv_for_group(df)
@@ -0,0 +1,47 @@
+"""Tests for GBM path generation."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from monte_carlo_exotics.asian_options import price_asian_geometric_mc
+from monte_carlo_exotics.mc_paths import generate_gbm_paths
+
+S0, R, SIGMA, T = 100.0, 0.05, 0.2, 1.0
+
+
+@pytest.mark.parametrize("engine", ["pseudo", "sobol"])
+def test_paths_shape_and_reproducibility(engine):
+    paths = generate_gbm_paths(S0, R, SIGMA, T, 16, 1_024, seed=5, engine=engine)
+    assert paths.shape == (1_024, 17)
+    assert (paths[:, 0] == S0).all()
+    assert (paths > 0).all()
+    again = generate_gbm_paths(S0, R, SIGMA, T, 16, 1_024, seed=5, engine=engine)
+    np.testing.assert_array_equal(paths, again)
+    other = generate_gbm_paths(S0, R, SIGMA, T, 16, 1_024, seed=6, engine=engine)
+    assert not np.array_equal(paths, other)
+
+
+@pytest.mark.parametrize("engine", ["pseudo", "sobol"])
+def test_terminal_mean_is_the_forward(engine):
+    paths = generate_gbm_paths(S0, R, SIGMA, T, 8, 2**14, seed=1, engine=engine)
+    stderr = paths[:, -1].std() / np.sqrt(paths.shape[0])
+    assert paths[:, -1].mean() == pytest.approx(S0 * np.exp(R * T), abs=5 * stderr)
+
+
+def test_invalid_engine_raises():
+    with pytest.raises(ValueError, match="engine"):
+        generate_gbm_paths(S0, R, SIGMA, T, 4, 16, engine="halton")
+
+
+def test_sobol_spread_across_seeds_is_much_smaller():
+    def spread(engine):
+        prices = [
+            price_asian_geometric_mc(
+                S0, 100.0, R, SIGMA, T, 16, 4_096, seed=seed, engine=engine
+            ).price
+            for seed in range(8)
+        ]
+        return np.std(prices)
+
+    assert spread("sobol") < spread("pseudo") / 4
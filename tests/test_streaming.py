@@ -0,0 +1,72 @@
+"""Tests for the streaming (path-free) Asian and barrier pricers."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from monte_carlo_exotics.asian_options import (
+    price_asian_arithmetic_mc,
+    price_asian_arithmetic_streaming,
+)
+from monte_carlo_exotics.barrier_options import (
+    price_barrier_streaming,
+    price_barrier_up_and_out_call_mc,
+)
+
+S0, K, H, R, SIGMA, T = 100.0, 100.0, 125.0, 0.05, 0.25, 1.0
+N_STEPS = 52
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_asian_streaming_matches_full_paths_within_one_tile(option_type):
+    n_paths = 4_000
+    full = price_asian_arithmetic_mc(
+        S0, K, R, SIGMA, T, N_STEPS, n_paths, option_type, seed=3
+    )
+    streamed = price_asian_arithmetic_streaming(
+        S0, K, R, SIGMA, T, N_STEPS, n_paths, option_type, seed=3, tile_size=n_paths
+    )
+    np.testing.assert_allclose(streamed.payoffs, full.payoffs, rtol=1e-10, atol=1e-10)
+    assert streamed.price == pytest.approx(full.price, rel=1e-12)
+
+
+def test_barrier_streaming_matches_full_paths_within_one_tile():
+    n_paths = 4_000
+    full = price_barrier_up_and_out_call_mc(
+        S0, K, H, R, SIGMA, T, N_STEPS, n_paths, seed=3
+    )
+    streamed = price_barrier_streaming(
+        S0, K, H, R, SIGMA, T, N_STEPS, n_paths, seed=3, tile_size=n_paths
+    )
+    np.testing.assert_allclose(streamed.payoffs, full.payoffs, rtol=1e-10, atol=1e-10)
+    assert streamed.price == pytest.approx(full.price, rel=1e-12)
+
+
+def test_tiled_streaming_agrees_within_monte_carlo_error():
+    # Several tiles consume the random stream in a different order, so the
+    # prices only agree statistically.
+    n_paths = 40_000
+    full = price_asian_arithmetic_mc(S0, K, R, SIGMA, T, N_STEPS, n_paths, seed=4)
+    tiled = price_asian_arithmetic_streaming(
+        S0, K, R, SIGMA, T, N_STEPS, n_paths, seed=4, tile_size=4_096
+    )
+    stderr = full.discount_factor * full.payoffs.std() / np.sqrt(n_paths)
+    assert tiled.price == pytest.approx(full.price, abs=5 * np.sqrt(2) * stderr)
+
+    full = price_barrier_up_and_out_call_mc(
+        S0, K, H, R, SIGMA, T, N_STEPS, n_paths, seed=4
+    )
+    tiled = price_barrier_streaming(
+        S0, K, H, R, SIGMA, T, N_STEPS, n_paths, seed=4, tile_size=4_096
+    )
+    stderr = full.discount_factor * full.payoffs.std() / np.sqrt(n_paths)
+    assert tiled.price == pytest.approx(full.price, abs=5 * np.sqrt(2) * stderr)
+
+
+def test_knocked_out_paths_pay_nothing():
+    result = price_barrier_streaming(
+        S0, K, H, R, SIGMA, T, N_STEPS, 2_000, seed=1, tile_size=512
+    )
+    assert (result.payoffs >= 0).all()
+    assert (result.payoffs < H - K).all()
+    assert (result.payoffs == 0).mean() > 0.5